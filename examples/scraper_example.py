@@ -55,12 +55,10 @@ def scrape_single_project(project_name: str):
     # Example pattern:
     #
     # attachments = scraper.get_project_attachments(project_url)
-    # for url in attachments:
-    #     filename = url.split('/')[-1]
-    #     base_path = f'downloads/{filename}'
+    # pairs = [(url, f"downloads/{url.split('/')[-1]}") for url in attachments]
     #
-    #     # Smart versioned download
-    #     actual_path, should_download = scraper.get_versioned_filepath(url, base_path)
+    # # Smart versioned download: the remote timestamps of all files are checked at once
+    # for url, (actual_path, should_download) in zip(attachments, scraper.get_versioned_filepaths(pairs)):
     #     if should_download:
     #         scraper.download_attachment(url, actual_path)
     #         # File saved with timestamp if it's an update:
@@ -1,93 +1,542 @@
+import calendar
+import hashlib
+import json
 import os
+import queue
+import re
 import requests
-from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from requests.adapters import HTTPAdapter, Retry
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from email.utils import parsedate_to_datetime
+from functools import cached_property
+from email.utils import formatdate, parsedate_to_datetime
 from tqdm import tqdm
+from urllib.parse import parse_qs, urlsplit
+
+# orjson decodes large API pages faster when installed; the stdlib parser works too
+try:
+	from orjson import loads as _json_loads
+except ImportError:
+	from json import loads as _json_loads
+
+
+# OAuth2 tokens are reused across runs until they expire
+TOKEN_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'intra42', 'token.json')
+# Default of arguments for which None is a meaningful value
+_DEFAULT = object()
+
+# RFC 7231 IMF-fixdate, the canonical HTTP date format: "Fri, 09 May 2025 12:16:12 GMT"
+_IMF_FIXDATE = re.compile(r'\w{3}, (\d{2}) (\w{3}) (\d{4}) (\d{2}):(\d{2}):(\d{2}) GMT')
+# Page number in a pagination link such as "/projects/list?page=17"
+_PAGE_QUERY = re.compile(r'[?&]page=(\d+)')
+_MONTHS = {
+	name: number for number, name in enumerate(
+		['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'], 1)
+}
+
+
+def _parse_http_date(value: str) -> float:
+	"""
+	Parse an HTTP date header (e.g. Last-Modified) into a Unix timestamp.
+
+	Args:
+		value (str): Header value, may be None
+
+	Returns:
+		float: Unix timestamp, or 0 if missing or unparsable
+	"""
+	if not value:
+		return 0
+	match = _IMF_FIXDATE.fullmatch(value)
+	if match and match[2] in _MONTHS:
+		day, month, year, hour, minute, second = match.groups()
+		return float(calendar.timegm((int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second))))
+	# Other RFC 2822 forms go through the generic (slower) parser
+	try:
+		return parsedate_to_datetime(value).timestamp()
+	except Exception:
+		return 0
+
+
+def _stat_or_none(path: str):
+	"""
+	Stat a file, treating a missing file as None.
+
+	Args:
+		path (str): Path of the file
+
+	Returns:
+		os.stat_result: File status, or None if the file doesn't exist
+	"""
+	try:
+		return os.stat(path)
+	except FileNotFoundError:
+		return None
+
+
+def _has_class(name: str) -> str:
+	"""
+	XPath predicate equivalent to the CSS class selector `.name`.
+
+	Args:
+		name (str): Class name
+
+	Returns:
+		str: Predicate matching elements whose class list contains `name`
+	"""
+	return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _parse_html(html, encoding: str = None):
+	"""
+	Parse an HTML document with lxml.
+
+	Raw response bytes are decoded by libxml2 directly, which skips the
+	Python-level decode done by response.text.
+
+	Args:
+		html (bytes | str): HTML of the page
+		encoding (str): Encoding of `html` when given as bytes. If None, lxml
+		                detects it from the document (default: None)
+
+	Returns:
+		lxml.html.HtmlElement: Root element, or None if the document is empty
+	"""
+	# Imported here so that API-only users never load lxml
+	from lxml import etree
+	from lxml import html as lxml_html
+
+	if encoding and isinstance(html, bytes):
+		return etree.fromstring(html, lxml_html.HTMLParser(encoding=encoding))
+	return etree.fromstring(html, lxml_html.html_parser)
+
+
+def _last_page_from_links(response):
+	"""
+	Read the last page number from a response's Link header (rel="last").
+
+	Args:
+		response (requests.Response): Paginated API response
+
+	Returns:
+		int: Last page number, or None if the header doesn't provide it
+	"""
+	last = response.links.get('last')
+	if not last:
+		return None
+	page = parse_qs(urlsplit(last['url']).query).get('page[number]')
+	return int(page[0]) if page else None
+
+
+def _has_next_page(response, items: list, page_size: int) -> bool:
+	"""
+	Tell whether a paginated response is followed by another page.
+
+	The Link header (rel="next") is authoritative; only without it does a
+	full page suggest there may be more.
+
+	Args:
+		response (requests.Response): Paginated API response
+		items (list): Items decoded from the response
+		page_size (int): Number of items per page
+
+	Returns:
+		bool: True if the next page should be requested
+	"""
+	if response.links:
+		return 'next' in response.links
+	return len(items) >= page_size
+
+
+def _last_page_from_total(response, page_size: int):
+	"""
+	Compute the last page number from a response's X-Total header (total item count).
+
+	Args:
+		response (requests.Response): Paginated API response
+		page_size (int): Number of items per page
+
+	Returns:
+		int: Last page number, or None if the header is missing or invalid
+	"""
+	try:
+		total = int(response.headers.get('X-Total'))
+	except (TypeError, ValueError):
+		return None
+	return max(1, -(-total // page_size))
+
+
+def _parse_attachment_html(html, encoding: str = None) -> list[str]:
+	"""
+	Extract the attachment links from a project page.
+
+	Module-level so it can run in a ProcessPoolExecutor.
+
+	Args:
+		html (bytes | str): HTML of the project page
+		encoding (str): Encoding of `html` when given as bytes (default: None)
+
+	Returns:
+		list[str]: List of attachment URLs
+	"""
+	tree = _parse_html(html, encoding)
+	if tree is None:
+		return []
+	return IntraScrape.XPATHS['attachment_links'](tree)
+
+
+def _attachment_filenames(urls: list[str]) -> list[str]:
+	"""
+	Pick a distinct file name for each attachment URL of a project.
+
+	Names are the last URL path segment. Attachments sharing one (e.g.
+	.../1/en.subject.pdf and .../2/en.subject.pdf) get their parent segment
+	appended, and a counter where that is not enough.
+
+	Args:
+		urls (list[str]): Attachment URLs of one project
+
+	Returns:
+		list[str]: File names, in input order
+	"""
+	paths = [urlsplit(url).path for url in urls]
+	counts = Counter(os.path.basename(path) for path in paths)
+	names = []
+	for path in paths:
+		name = os.path.basename(path)
+		stem, ext = os.path.splitext(name)
+		parent = os.path.basename(os.path.dirname(path))
+		if counts[name] > 1 and parent:
+			name = f"{stem}_{parent}{ext}"
+			stem, ext = os.path.splitext(name)
+		unique, n = name, 1
+		while unique in names:
+			n += 1
+			unique = f"{stem}_{n}{ext}"
+		names.append(unique)
+	return names
+
+
+def _default_max_workers() -> int:
+	"""
+	Default thread count for parallel requests.
+
+	Returns:
+		int: For I/O-bound tasks (web scraping), 2x CPU count, capped at 32
+	"""
+	return min(32, (os.cpu_count() or 4) * 2)
+
+
+def _preallocate(f, size: int) -> bool:
+	"""
+	Reserve disk space for a file in a single call, where the platform supports it.
+
+	Args:
+		f (file): Binary file object opened for writing
+		size (int): Number of bytes to reserve
+
+	Returns:
+		bool: Whether the space was reserved
+	"""
+	if not hasattr(os, 'posix_fallocate'):
+		return False
+	try:
+		os.posix_fallocate(f.fileno(), 0, size)
+	except OSError:
+		# e.g. filesystems without fallocate support
+		return False
+	return True
+
+
+def _write_chunks(f, chunks: queue.Queue, errors: list):
+	"""
+	Writer thread body: write chunks to f until the None sentinel arrives.
+
+	After a failed write the remaining chunks are drained without writing so
+	the producer never blocks on a full queue.
+
+	Args:
+		f (file): Binary file object to write to
+		chunks (queue.Queue): Queue of byte chunks, terminated by None
+		errors (list): Receives the exception raised by a failed write
+	"""
+	while True:
+		chunk = chunks.get()
+		if chunk is None:
+			return
+		if errors:
+			continue
+		try:
+			f.write(chunk)
+		except Exception as e:
+			errors.append(e)
+
+
+class _XPaths(dict):
+	"""
+	XPath expressions compiled on first lookup, then kept.
+
+	Deferring the compilation keeps lxml out of `import intra42` for code
+	that only uses IntraAPI.
+
+	Args:
+		**sources: Name -> (expression, smart_strings)
+	"""
+	def __init__(self, **sources):
+		super().__init__()
+		self._sources = sources
+
+	def __missing__(self, name):
+		from lxml import etree
+
+		expression, smart_strings = self._sources[name]
+		compiled = self[name] = etree.XPath(expression, smart_strings=smart_strings)
+		return compiled
+
 
 class IntraScrape:
-	SELECTORS = {
-		'projects_list': 'ul.projects-list--list',
-		'project_item': 'li.project-item',
-		'project_name': 'div.project-name',
-		'attachment_name': 'h4.attachment-name'
-	}
+	# Compiled once per process instead of on every page; @href results are plain
+	# strings (smart_strings=False) that don't keep the parsed page alive
+	XPATHS = _XPaths(
+		# li.project-item inside the first ul.projects-list--list
+		project_items=(f"(//ul[{_has_class('projects-list--list')}])[1]//li[{_has_class('project-item')}]", True),
+		# First link of the first div.project-name, relative to a project item
+		project_link=(f"(.//div[{_has_class('project-name')}])[1]/descendant::a[1]", True),
+		# First link of every h4.attachment-name
+		attachment_links=(f"//h4[{_has_class('attachment-name')}]/descendant::a[1]/@href", False),
+		# #projects-list-container > div > ul > li.last > a
+		last_page_link=(f"//*[@id='projects-list-container']/div/ul/li[{_has_class('last')}]/a/@href", False)
+	)
+	# Bytes read per iteration when streaming downloads to disk
+	DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+	# Progress bars are updated at most every PROGRESS_UPDATE_BYTES or PROGRESS_UPDATE_INTERVAL seconds
+	PROGRESS_UPDATE_BYTES = 256 * 1024
+	PROGRESS_UPDATE_INTERVAL = 0.1
+	# Seconds a scraped project list (and its page count) is reused before scraping it again
+	PROJECT_LIST_TTL = 600
+	# Sessions shared by all instances with the same cookies, so they share one connection pool
+	_sessions = {}
+	_sessions_lock = threading.Lock()
 	
-	def __init__(self, cookies):
-		self.session = requests.Session()
-		self.session.cookies.update(cookies)
+	def __init__(self, cookies, pool_size: int = None, session_factory=None):
+		"""
+		Args:
+			cookies (dict): Session cookies for projects.intra.42.fr
+			pool_size (int): Connections kept open per host, which is also the most
+			                 requests in flight per host. If None, matches the
+			                 default parallel worker count (default: None)
+			session_factory (callable): Creates the underlying session
+			                            (default: requests.Session)
+		"""
+		self.session = self._session_for(cookies, pool_size, session_factory or requests.Session)
 		self.all_projects = []
 		self.projects_to_scrape = []
+		self._projects_by_lname = {}
+		self._indexed_projects = (None, 0)
+		self._total_pages = None
+		# time.monotonic() of the last scrape; None for values not scraped here (never expire)
+		self._total_pages_at = None
+		self._projects_loaded_at = None
+		self._remote_modified_times = {}
 		self.base_url = "https://projects.intra.42.fr"
 	
-	def _get_project_list_page(self, page: int = 1):
+	@classmethod
+	def _session_for(cls, cookies, pool_size: int, session_factory):
 		"""
-		Helper method to retrieve the raw list of project items from a single page.
+		Helper method returning the shared session for a cookie set, creating it on first use.
+
+		Args:
+			cookies (dict): Session cookies for projects.intra.42.fr
+			pool_size (int): Connections kept open per host (None: default worker count)
+			session_factory (callable): Creates the session if there is none yet
+		Returns:
+			requests.Session: Session with the cookies, pooled adapter and headers set up
+		"""
+		key = (frozenset(cookies.items()), pool_size, session_factory)
+		with cls._sessions_lock:
+			session = cls._sessions.get(key)
+			if session is None:
+				session = session_factory()
+				session.cookies.update(cookies)
+				# The default pool keeps 10 connections; size it to the worker count so
+				# parallel requests reuse connections instead of opening new TLS ones.
+				# Blocking on a full pool makes it a shared concurrency limit: extra
+				# threads (e.g. both stages of scrape_all) wait instead of flooding the site
+				adapter = HTTPAdapter(
+					pool_connections=20,
+					pool_maxsize=pool_size or _default_max_workers(),
+					pool_block=True,
+					max_retries=Retry(
+						total=5,
+						backoff_factor=0.5,
+						status_forcelist=[429, 500, 502, 503, 504],
+						raise_on_status=False
+					)
+				)
+				session.mount('https://', adapter)
+				cls._sessions[key] = session
+		return session
+
+	@cached_property
+	def _project_list_url(self) -> str:
+		"""
+		URL template of the project list pages, built once from base_url.
+
+		Returns:
+			str: URL with a {} placeholder for the page number
+		"""
+		return self.base_url + "/projects/list?page={}"
+
+	def _fetch_project_list_page(self, page: int = 1) -> tuple[bytes, str]:
+		"""
+		Helper method to download the raw HTML of a single project list page.
 
 		Args:
 			page (int): Page number to retrieve (default: 1)
 
 		Returns:
-			list[BeautifulSoup Tag]: List of project item HTML elements
+			tuple[bytes, str]: (HTML of the page, its encoding)
 		"""
-		url = f"{self.base_url}/projects/list?page={page}"
+		url = self._project_list_url.format(page)
 		response = self.session.get(url)
 		if response.status_code != 200:
 			raise Exception(f"Failed to retrieve projects: {response.status_code}")
-		soup = BeautifulSoup(response.text, 'html.parser')
-		# Use select_one() to find the first matching element
-		projects_ul = soup.select_one(self.SELECTORS['projects_list'])
-		if not projects_ul:
+		return (response.content, response.encoding)
+
+	def _parse_project_list_page(self, html, encoding: str = None):
+		"""
+		Helper method to extract the project items from a project list page.
+
+		Args:
+			html (bytes | str): HTML of the page
+			encoding (str): Encoding of `html` when given as bytes (default: None)
+
+		Returns:
+			list[lxml.html.HtmlElement]: List of project item HTML elements
+		"""
+		tree = _parse_html(html, encoding)
+		if tree is None:
 			return []
-		# Use select() to find all matching elements
-		project_items = projects_ul.select(self.SELECTORS['project_item'])
-		return project_items
+		return self.XPATHS['project_items'](tree)
 
-	def _get_total_pages(self):
+	def _get_project_list_page(self, page: int = 1):
 		"""
-		Get the total number of pages by checking the pagination on the first page.
+		Helper method to retrieve the raw list of project items from a single page.
+
+		Args:
+			page (int): Page number to retrieve (default: 1)
 
 		Returns:
-			int: Total number of pages
+			list[lxml.html.HtmlElement]: List of project item HTML elements
 		"""
-		url = f"{self.base_url}/projects/list"
-		response = self.session.get(url)
-		if response.status_code != 200:
-			raise Exception(f"Failed to retrieve projects: {response.status_code}")
-		soup = BeautifulSoup(response.text, 'html.parser')
+		return self._parse_project_list_page(*self._fetch_project_list_page(page))
+
+	def _parse_list_page(self, html, encoding: str = None) -> tuple[list, int]:
+		"""
+		Helper method to extract both the project items and the total number of
+		pages from a project list page, parsing the HTML only once.
+
+		Args:
+			html (bytes | str): HTML of a project list page
+			encoding (str): Encoding of `html` when given as bytes (default: None)
+
+		Returns:
+			tuple[list[lxml.html.HtmlElement], int]: (project items, total number of pages)
+		"""
+		tree = _parse_html(html, encoding)
+		if tree is None:
+			return ([], 1)
+		return (self.XPATHS['project_items'](tree), self._read_total_pages(tree))
 
+	def _read_total_pages(self, tree) -> int:
+		"""
+		Helper method to read the total number of pages from a parsed project list page.
+
+		Args:
+			tree (lxml.html.HtmlElement): Parsed project list page
+
+		Returns:
+			int: Total number of pages
+		"""
 		# Find last page link: #projects-list-container > div > ul > li.last > a
-		last_page_link = soup.select_one('#projects-list-container > div > ul > li.last > a')
-		if last_page_link and last_page_link.get('href'):
+		hrefs = self.XPATHS['last_page_link'](tree)
+		if hrefs:
 			# Extract page number from href like "/projects/list?page=17"
-			href = last_page_link['href']
-			if 'page=' in href:
-				return int(href.split('page=')[1].split('&')[0])
+			match = _PAGE_QUERY.search(hrefs[0])
+			if match:
+				return int(match[1])
 
 		# Fallback: assume only 1 page
 		return 1
 
+	def _get_total_pages(self):
+		"""
+		Get the total number of pages by checking the pagination on the first page.
+
+		The result is remembered for PROJECT_LIST_TTL seconds, so repeated calls
+		don't cost a request.
+
+		Returns:
+			int: Total number of pages
+		"""
+		return self._load_total_pages()[1]
+
+	def _load_total_pages(self) -> tuple[list, int]:
+		"""
+		Helper method scraping the page count from page 1 unless a fresh one is remembered.
+
+		Returns:
+			tuple[list, int]: (page 1 items if page 1 was scraped, else None, total number of pages)
+		"""
+		page1_items = None
+		if self._total_pages is None or self._is_stale(self._total_pages_at):
+			page1_items, self._total_pages = self._parse_list_page(*self._fetch_project_list_page(1))
+			self._total_pages_at = time.monotonic()
+		return (page1_items, self._total_pages)
+
+	def _is_stale(self, loaded_at: float) -> bool:
+		"""
+		Helper method telling whether a scraped value has outlived PROJECT_LIST_TTL.
+
+		Args:
+			loaded_at (float): time.monotonic() when the value was scraped, or None
+
+		Returns:
+			bool: True if the value should be scraped again
+		"""
+		return loaded_at is not None and time.monotonic() - loaded_at >= self.PROJECT_LIST_TTL
+
 	def _get_project_list(self, parallel: bool = True, max_workers: int = None):
 		"""
 		Helper method to retrieve all project items from all pages.
 
+		Page 1 is fetched and parsed once and serves both the page count and
+		its own items. Once the page count is known, every page is fetched at once.
+
 		Args:
 			parallel (bool): Whether to fetch pages in parallel (default: True)
 			max_workers (int): Number of parallel threads. If None, uses min(32, cpu_count * 2).
 			                   Only used when parallel=True (default: None)
 
 		Returns:
-			list[BeautifulSoup Tag]: List of all project item HTML elements
+			list[lxml.html.HtmlElement]: List of all project item HTML elements
 		"""
-		total_pages = self._get_total_pages()
+		# Items of pages that are already parsed, keyed by page number
+		results = {}
+		page1_items, total_pages = self._load_total_pages()
+		if page1_items is not None:
+			results[1] = page1_items
+		pages = [page for page in range(1, total_pages + 1) if page not in results]
 
 		if not parallel:
 			# Sequential fetching
 			print(f"Fetching {total_pages} pages sequentially...")
 			all_items = []
 			for page in range(1, total_pages + 1):
-				items = self._get_project_list_page(page)
+				items = results[page] if page in results else self._get_project_list_page(page)
 				all_items.extend(items)
 				print(f"Loaded page {page}/{total_pages}: {len(items)} projects")
 			print(f"Total projects loaded: {len(all_items)}")
@@ -95,25 +544,34 @@ class IntraScrape:
 
 		# Parallel fetching
 		if max_workers is None:
-			# For I/O-bound tasks (web scraping), use 2x CPU count, capped at 32
-			max_workers = min(32, (os.cpu_count() or 4) * 2)
+			max_workers = _default_max_workers()
+		# Never spawn more threads than there are pages to fetch
+		max_workers = max(1, min(max_workers, len(pages)))
 
 		print(f"Fetching {total_pages} pages in parallel with {max_workers} workers...")
 
-		executor = ThreadPoolExecutor(max_workers=max_workers)
-		try:
-			results = list(executor.map(self._get_project_list_page, range(1, total_pages + 1)))
-		except KeyboardInterrupt:
-			print("\n\n⚠️  Interrupt received during page fetching. Cleaning up...")
-			executor.shutdown(wait=False, cancel_futures=True)
-			raise
-		finally:
-			executor.shutdown(wait=True)
+		if pages:
+			# Workers only download; pages are parsed here as they arrive, so
+			# parsing overlaps with the requests still in flight
+			executor = ThreadPoolExecutor(max_workers=max_workers)
+			try:
+				futures = {
+					executor.submit(self._fetch_project_list_page, page): page
+					for page in pages
+				}
+				for future in as_completed(futures):
+					results[futures[future]] = self._parse_project_list_page(*future.result())
+			except KeyboardInterrupt:
+				print("\n\n⚠️  Interrupt received during page fetching. Cleaning up...")
+				executor.shutdown(wait=False, cancel_futures=True)
+				raise
+			finally:
+				executor.shutdown(wait=True)
 
-		# Flatten results
+		# Flatten results in page order
 		all_items = []
-		for items in results:
-			all_items.extend(items)
+		for page in range(1, total_pages + 1):
+			all_items.extend(results[page])
 
 		print(f"Total projects loaded: {len(all_items)}")
 		return all_items
@@ -121,6 +579,8 @@ class IntraScrape:
 	def get_projects_to_scrape(self, project_names: list[str], parallel: bool = True, max_workers: int = None) -> list[dict]:
 		"""
 		Filters and retrieves the list of projects to scrape based on provided names.
+
+		Every project carrying a requested name is included, in the requested order.
 		Args:
 			project_names (list[str]): List of project names to scrape
 			parallel (bool): Whether to fetch pages in parallel (default: True)
@@ -128,39 +588,62 @@ class IntraScrape:
 		Returns:
 			list[dict]: List of projects with 'name' and 'url' keys
 		"""
-		if not self.all_projects:
-			self.get_all_projects(parallel=parallel, max_workers=max_workers)
-		filtered_projects = [
-			proj for proj in self.all_projects
-			if proj['name'].lower() in (name.lower() for name in project_names)
-		]
+		self.get_all_projects(parallel=parallel, max_workers=max_workers)
+		projects_by_name = self._get_project_index()
+		# dict.fromkeys() drops duplicate names while keeping the requested order
+		wanted = dict.fromkeys(name.lower() for name in project_names)
+		filtered_projects = [proj for name in wanted for proj in projects_by_name.get(name, ())]
 		self.projects_to_scrape = filtered_projects
 		return filtered_projects
 
-	def get_all_projects(self, parallel: bool = True, max_workers: int = None) -> list[dict]:
+	def _get_project_index(self) -> dict:
+		"""
+		Helper method to map lowercased project names to projects.
+
+		The index is rebuilt whenever all_projects has been replaced or resized.
+
+		Returns:
+			dict: Lowercased project name -> list of project dicts with that name,
+			      in all_projects order
+		"""
+		indexed, indexed_len = self._indexed_projects
+		if indexed is not self.all_projects or indexed_len != len(self.all_projects):
+			self._projects_by_lname = {}
+			for proj in self.all_projects:
+				self._projects_by_lname.setdefault(proj['name'].lower(), []).append(proj)
+			self._indexed_projects = (self.all_projects, len(self.all_projects))
+		return self._projects_by_lname
+
+	def get_all_projects(self, parallel: bool = True, max_workers: int = None, refresh: bool = False) -> list[dict]:
 		"""
 		Retrieves the list of projects from the 42 intra projects page.
+
+		The list is reused for PROJECT_LIST_TTL seconds (it changes rarely),
+		so repeated lookups don't scrape every page again.
+
 		Args:
 			parallel (bool): Whether to fetch pages in parallel (default: True)
 			max_workers (int): Number of parallel threads (default: auto-detect)
+			refresh (bool): Scrape the list even if the cached one is still fresh (default: False)
 		Returns:
 			list[dict]: List of projects with 'name' and 'url' keys
 		"""
+		if self.all_projects and not refresh and not self._is_stale(self._projects_loaded_at):
+			return self.all_projects
+		if refresh:
+			self._total_pages = None
 		all_projects = []
 		project_items = self._get_project_list(parallel=parallel, max_workers=max_workers)
 		for item in project_items:
-			# Use select_one() with the selector from SELECTORS
-			project_name_div = item.select_one(self.SELECTORS['project_name'])
-			if not project_name_div:
-				continue
-			project_link = project_name_div.find('a')
+			project_link = self.XPATHS['project_link'](item)
 			if not project_link:
 				continue
 			all_projects.append({
-				'name': project_link.text.strip(),
-				'url': project_link['href']
+				'name': project_link[0].text_content().strip(),
+				'url': project_link[0].get('href')
 			})
 		self.all_projects = all_projects
+		self._projects_loaded_at = time.monotonic()
 		return all_projects
 	
 	def get_project_attachments(self, project_url: str) -> list[str]:
@@ -171,18 +654,57 @@ class IntraScrape:
 		Returns:
 			list[str]: List of attachment URLs
 		"""
+		links = _parse_attachment_html(*self._fetch_project_page(project_url))
+		if not links:
+			tqdm.write(f"No attachments found for project: {project_url}")
+			return []
+		return links
+
+	def _fetch_project_page(self, project_url: str) -> tuple[bytes, str]:
+		"""
+		Helper method to download the raw HTML of a project page.
+
+		Args:
+			project_url (str): URL path of the project
+
+		Returns:
+			tuple[bytes, str]: (HTML of the page, its encoding)
+		"""
 		url = self.base_url + project_url
 		response = self.session.get(url)
 		if response.status_code != 200:
 			raise Exception(f"Failed to retrieve project page: {response.status_code}")
-		soup = BeautifulSoup(response.text, 'html.parser')
-		# Use select() to find all matching elements
-		attachments_div = soup.select(self.SELECTORS['attachment_name'])
-		if not attachments_div:
-			tqdm.write(f"No attachments found for project: {project_url}")
-			return []
-		links = [att.find('a')['href'] for att in attachments_div if att.find('a')]
-		return links
+		return (response.content, response.encoding)
+
+	def get_many_project_attachments(self, project_urls: list[str], max_workers: int = None, process_threshold: int = 50) -> dict[str, list[str]]:
+		"""
+		Retrieves the attachment links of many projects at once.
+
+		Pages are downloaded in parallel threads. For large batches, parsing
+		moves to a process pool so it doesn't compete with the downloads for
+		the GIL; below the threshold, process start-up would cost more than it saves.
+
+		Args:
+			project_urls (list[str]): URL paths of the projects
+			max_workers (int): Number of download threads (default: auto-detect)
+			process_threshold (int): Minimum number of pages for which parsing
+			                         uses a process pool (default: 50)
+		Returns:
+			dict[str, list[str]]: Attachment URLs keyed by project URL
+		"""
+		if not project_urls:
+			return {}
+		max_workers = min(max_workers or _default_max_workers(), len(project_urls))
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			pages = list(executor.map(self._fetch_project_page, project_urls))
+
+		contents, encodings = zip(*pages)
+		if len(project_urls) >= process_threshold:
+			with ProcessPoolExecutor() as executor:
+				link_lists = list(executor.map(_parse_attachment_html, contents, encodings, chunksize=8))
+		else:
+			link_lists = list(map(_parse_attachment_html, contents, encodings))
+		return dict(zip(project_urls, link_lists))
 	
 	def get_project_url_by_name(self, project_name: str) -> str:
 		"""
@@ -192,32 +714,55 @@ class IntraScrape:
 		Returns:
 			str: URL of the project or None if not found
 		"""
-		if not self.all_projects:
-			self.get_all_projects()
-		url = [proj['url'] for proj in self.all_projects if proj['name'].lower() == project_name.lower()]
-		return url[0] if url else None
+		self.get_all_projects()
+		projects = self._get_project_index().get(project_name.lower())
+		# First match wins when several projects share the name
+		return projects[0]['url'] if projects else None
 
-	def get_remote_modified_time(self, attachment_url: str) -> float:
+	def get_remote_modified_time(self, attachment_url: str, use_cache: bool = True) -> float:
 		"""
 		Get the last modified timestamp of a remote file without downloading it.
 
+		Known timestamps are remembered per URL for the lifetime of the scraper.
+
 		Args:
 			attachment_url (str): URL of the attachment
+			use_cache (bool): Whether to reuse a previously seen timestamp (default: True)
 
 		Returns:
 			float: Unix timestamp of last modification, or 0 if not available
 		"""
+		if use_cache and attachment_url in self._remote_modified_times:
+			return self._remote_modified_times[attachment_url]
 		try:
 			response = self.session.head(attachment_url, timeout=10)
 			if response.status_code == 200:
-				last_modified = response.headers.get('Last-Modified')
-				if last_modified:
-					dt = parsedate_to_datetime(last_modified)
-					return dt.timestamp()
+				remote_time = _parse_http_date(response.headers.get('Last-Modified'))
+				if remote_time:
+					self._remote_modified_times[attachment_url] = remote_time
+				return remote_time
 		except Exception:
 			pass
 		return 0
 
+	@staticmethod
+	def _get_versioned_path(base_save_path: str, remote_time: float) -> str:
+		"""
+		Build the timestamped variant of a save path, e.g. file_20250509_141612.pdf
+
+		Args:
+			base_save_path (str): Original save path (e.g., "/path/to/file.pdf")
+			remote_time (float): Unix timestamp of the remote file
+
+		Returns:
+			str: Versioned save path
+		"""
+		directory = os.path.dirname(base_save_path) or '.'
+		filename = os.path.basename(base_save_path)
+		base_name, ext = os.path.splitext(filename)
+		timestamp_str = datetime.fromtimestamp(remote_time).strftime('%Y%m%d_%H%M%S')
+		return os.path.join(directory, f"{base_name}_{timestamp_str}{ext}")
+
 	def get_versioned_filepath(self, attachment_url: str, base_save_path: str) -> tuple[str, bool]:
 		"""
 		Determine the filepath for saving, using remote timestamp in filename.
@@ -236,28 +781,57 @@ class IntraScrape:
 			tuple[str, bool]: (filepath to save to, whether to download)
 		"""
 		remote_time = self.get_remote_modified_time(attachment_url)
+		return self._resolve_versioned_filepath(base_save_path, remote_time)
+
+	def get_versioned_filepaths(self, pairs: list[tuple[str, str]], max_workers: int = None) -> list[tuple[str, bool]]:
+		"""
+		Batch variant of get_versioned_filepath() that checks all remote timestamps in parallel.
+
+		The HEAD requests share the session's pooled keep-alive connections.
+
+		Args:
+			pairs (list[tuple[str, str]]): (attachment URL, base save path) pairs
+			max_workers (int): Number of parallel HEAD requests (default: auto-detect)
+
+		Returns:
+			list[tuple[str, bool]]: (filepath to save to, whether to download), in input order
+		"""
+		if not pairs:
+			return []
+		max_workers = min(max_workers or _default_max_workers(), len(pairs))
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			remote_times = list(executor.map(self.get_remote_modified_time, [url for url, _ in pairs]))
+		return [
+			self._resolve_versioned_filepath(base_save_path, remote_time)
+			for (_, base_save_path), remote_time in zip(pairs, remote_times)
+		]
+
+	def _resolve_versioned_filepath(self, base_save_path: str, remote_time: float) -> tuple[str, bool]:
+		"""
+		Helper method with the local side of get_versioned_filepath().
+
+		Args:
+			base_save_path (str): Original save path (e.g., "/path/to/file.pdf")
+			remote_time (float): Unix timestamp of the remote file, or 0 if unknown
+
+		Returns:
+			tuple[str, bool]: (filepath to save to, whether to download)
+		"""
 		if remote_time == 0:
 			# Can't determine remote time, don't download
 			return (base_save_path, False)
 
-		# Parse base path
-		directory = os.path.dirname(base_save_path) or '.'
-		filename = os.path.basename(base_save_path)
-		base_name, ext = os.path.splitext(filename)
-
-		# Format remote timestamp
-		timestamp_str = datetime.fromtimestamp(remote_time).strftime('%Y%m%d_%H%M%S')
-		versioned_filename = f"{base_name}_{timestamp_str}{ext}"
-		versioned_path = os.path.join(directory, versioned_filename)
+		versioned_path = self._get_versioned_path(base_save_path, remote_time)
 
 		# Check if versioned file already exists
-		if os.path.exists(versioned_path):
+		if _stat_or_none(versioned_path):
 			return (versioned_path, False)
 
-		# Check if base file exists
-		if os.path.exists(base_save_path):
+		# Check if base file exists (one stat call for existence and mtime)
+		base_stat = _stat_or_none(base_save_path)
+		if base_stat:
 			# Check if base file matches remote timestamp (tolerance of 1 second)
-			local_time = os.path.getmtime(base_save_path)
+			local_time = base_stat.st_mtime
 			if abs(local_time - remote_time) <= 1:
 				# Base file is same version as remote
 				return (base_save_path, False)
@@ -267,67 +841,322 @@ class IntraScrape:
 		# No files exist yet, use base filename for first download
 		return (base_save_path, True)
 
-	def download_attachment(self, attachment_url: str, save_path: str, show_progress: bool = True):
+	def download_versioned(self, attachment_url: str, base_save_path: str, show_progress: bool = True) -> tuple[str, bool]:
+		"""
+		Download an attachment with versioning using a single conditional GET.
+
+		Same outcome as get_versioned_filepath() followed by download_attachment(),
+		but the local copy is validated with If-Modified-Since instead of a HEAD
+		probe: an unchanged file costs one header-only 304 response.
+
+		Args:
+			attachment_url (str): URL of the remote attachment
+			base_save_path (str): Original save path (e.g., "/path/to/file.pdf")
+			show_progress (bool): Whether to show a progress bar for large files (default: True)
+
+		Returns:
+			tuple[str, bool]: (filepath of the local copy, whether a download occurred)
+		"""
+		base_stat = _stat_or_none(base_save_path)
+		with self._get_if_modified(attachment_url, base_stat) as response:
+			if response.status_code == 304:
+				# Base file is same version as remote
+				return (base_save_path, False)
+
+			# Same decision as get_versioned_filepath(), with the time from this response
+			remote_time = _parse_http_date(response.headers.get('Last-Modified'))
+			save_path, should_download = self._resolve_versioned_filepath(base_save_path, remote_time)
+			if not should_download:
+				return (save_path, False)
+
+			self._save_response(response, save_path, show_progress)
+		return (save_path, True)
+
+	def _get_if_modified(self, attachment_url: str, local_stat):
+		"""
+		Start a streaming GET, conditional on the local copy's modification time.
+
+		Args:
+			attachment_url (str): URL of the attachment
+			local_stat (os.stat_result): Stat of the local copy, or None if there is none
+
+		Returns:
+			requests.Response: Streaming response with status 200 or 304 (Not Modified)
+		"""
+		headers = {}
+		if local_stat:
+			headers['If-Modified-Since'] = formatdate(local_stat.st_mtime, usegmt=True)
+
+		response = self.session.get(attachment_url, headers=headers, stream=True, timeout=30)
+		if response.status_code not in (200, 304):
+			response.close()
+			raise Exception(f"Failed to download attachment: {response.status_code}")
+		return response
+
+	def download_attachment(self, attachment_url: str, save_path: str, show_progress: bool = True) -> bool:
 		"""
 		Download an attachment with optional progress bar and set modification time
 
+		If save_path already exists, the request carries If-Modified-Since with
+		its timestamp, and an unchanged file is left alone (304 Not Modified).
+
 		Args:
 			attachment_url (str): URL of the attachment to download
 			save_path (str): Path where to save the file
 			show_progress (bool): Whether to show a progress bar for large files (default: True)
+
+		Returns:
+			bool: Whether the file was downloaded
 		"""
-		with self.session.get(attachment_url, stream=True, timeout=30) as response:
-			if response.status_code != 200:
-				raise Exception(f"Failed to download attachment: {response.status_code}")
-
-			# Get total file size and last modified time from headers
-			total_size = int(response.headers.get('content-length', 0))
-			last_modified = response.headers.get('Last-Modified')
-
-			# Only show progress bar for files larger than 1MB
-			if show_progress and total_size > 1_000_000:
-				# Extract filename for progress bar description
-				filename = save_path.split('/')[-1]
-				progress_bar = tqdm(
-					total=total_size,
-					unit='B',
-					unit_scale=True,
-					unit_divisor=1024,
-					desc=f"    {filename}",
-					leave=False
-				)
-			else:
-				progress_bar = None
+		with self._get_if_modified(attachment_url, _stat_or_none(save_path)) as response:
+			if response.status_code == 304:
+				return False
+			self._save_response(response, save_path, show_progress)
+		return True
 
-			with open(save_path, 'wb') as f:
-				for chunk in response.iter_content(chunk_size=8192):
-					if chunk:
-						f.write(chunk)
-						if progress_bar:
-							progress_bar.update(len(chunk))
+	def download_all_attachments(self, items: list[tuple[str, str]], max_concurrent: int = 5, show_progress: bool = True) -> list[bool]:
+		"""
+		Download many attachments concurrently with download_attachment().
+
+		Waiting on one file no longer leaves the connection idle for the next;
+		max_concurrent keeps the load on the CDN bounded.
+
+		Args:
+			items (list[tuple[str, str]]): (attachment URL, save path) pairs
+			max_concurrent (int): Maximum simultaneous downloads (default: 5)
+			show_progress (bool): Whether to show an overall progress bar (default: True)
+
+		Returns:
+			list[bool]: Whether each file was downloaded (False if unchanged), in input order
+		"""
+		if not items:
+			return []
+		progress_bar = tqdm(total=len(items), unit='file', leave=False) if show_progress else None
 
+		def download(item):
+			url, save_path = item
+			downloaded = self.download_attachment(url, save_path, show_progress=False)
+			if progress_bar:
+				progress_bar.update(1)
+			return downloaded
+
+		try:
+			with ThreadPoolExecutor(max_workers=min(max_concurrent, len(items))) as executor:
+				return list(executor.map(download, items))
+		finally:
 			if progress_bar:
 				progress_bar.close()
 
-		# Set the file's modification time to match the remote file
-		if last_modified:
+	def scrape_all(self, out_dir: str, project_names: list[str] = None, max_workers: int = None, show_progress: bool = False) -> dict[str, list[tuple[str, bool]]]:
+		"""
+		Download the attachments of all (or the named) projects in one pipeline.
+
+		Stages overlap instead of running one after the other: a project's files
+		start downloading as soon as its page is parsed, while the remaining
+		project pages are still being fetched. Files are saved as
+		out_dir/<project>/<filename> through download_versioned(), so unchanged
+		files are skipped and updated ones get a versioned copy. Attachments of
+		one project with the same file name get the parent URL segment appended
+		(en.subject_<segment>.pdf). A project whose page can't be retrieved is
+		reported and left with no files.
+
+		Args:
+			out_dir (str): Root directory for the downloaded files
+			project_names (list[str]): Only scrape these projects (default: all)
+			max_workers (int): Number of threads per stage (default: auto-detect)
+			show_progress (bool): Whether to show progress bars for large files (default: False)
+
+		Returns:
+			dict[str, list[tuple[str, bool]]]: (filepath, whether a download occurred)
+			                                   for each attachment, keyed by project URL
+		"""
+		if project_names:
+			projects = self.get_projects_to_scrape(project_names)
+		else:
+			projects = self.get_all_projects()
+		max_workers = max_workers or _default_max_workers()
+
+		results = {project['url']: [] for project in projects}
+		downloads = []
+		with ThreadPoolExecutor(max_workers=max_workers) as page_executor, \
+				ThreadPoolExecutor(max_workers=max_workers) as download_executor:
+			pages = {
+				page_executor.submit(self.get_project_attachments, project['url']): project['url']
+				for project in projects
+			}
+			for future in as_completed(pages):
+				project_url = pages[future]
+				try:
+					urls = future.result()
+				except Exception as e:
+					# One unreachable project page shouldn't cost the other projects' results
+					tqdm.write(f"Failed to get attachments for project {project_url}: {e}")
+					continue
+				project_dir = os.path.join(out_dir, project_url.rstrip('/').split('/')[-1])
+				os.makedirs(project_dir, exist_ok=True)
+				# Concurrent downloads must never share a target (or its .part file)
+				for url, filename in zip(urls, _attachment_filenames(urls)):
+					save_path = os.path.join(project_dir, filename)
+					downloads.append((project_url, download_executor.submit(
+						self.download_versioned, url, save_path, show_progress)))
+			for project_url, future in downloads:
+				results[project_url].append(future.result())
+		return results
+
+	def _write_response(self, response, save_path: str, show_progress: bool, filename: str = None):
+		"""
+		Stream a response body to disk, with a progress bar for files over 1MB.
+
+		Args:
+			response (requests.Response): Streaming response to read from
+			save_path (str): Path where to save the file
+			show_progress (bool): Whether to show a progress bar for large files
+			filename (str): Name shown on the progress bar (default: basename of save_path)
+		"""
+		# Get total file size from headers
+		total_size = int(response.headers.get('content-length', 0))
+
+		# Only show progress bar for files larger than 1MB
+		if show_progress and total_size > 1_000_000:
+			# Extract filename for progress bar description
+			filename = filename or save_path.split('/')[-1]
+			progress_bar = tqdm(
+				total=total_size,
+				unit='B',
+				unit_scale=True,
+				unit_divisor=1024,
+				desc=f"    {filename}",
+				leave=False
+			)
+		else:
+			progress_bar = None
+
+		# Disk writes run on a writer thread so the next chunk is received
+		# while the previous one is flushed; one slot bounds buffered memory
+		chunks = queue.Queue(maxsize=1)
+		errors = []
+		# Bytes received since the progress bar was last updated
+		pending = 0
+		last_update = time.monotonic()
+		with open(save_path, 'wb') as f:
+			preallocated = total_size > 1_000_000 and _preallocate(f, total_size)
+			writer = threading.Thread(target=_write_chunks, args=(f, chunks, errors), daemon=True)
+			writer.start()
+			try:
+				for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+					if errors:
+						break
+					if chunk:
+						chunks.put(chunk)
+						if progress_bar:
+							pending += len(chunk)
+							now = time.monotonic()
+							if pending >= self.PROGRESS_UPDATE_BYTES or now - last_update >= self.PROGRESS_UPDATE_INTERVAL:
+								progress_bar.update(pending)
+								pending = 0
+								last_update = now
+			finally:
+				chunks.put(None)
+				writer.join()
+				if preallocated:
+					# Drop the reserved space past the last written byte, also when the
+					# transfer failed, and when Content-Length differs from the decoded
+					# body size (compression)
+					f.truncate()
+
+		if progress_bar:
+			if pending:
+				progress_bar.update(pending)
+			progress_bar.close()
+		if errors:
+			raise errors[0]
+
+	def _save_response(self, response, save_path: str, show_progress: bool):
+		"""
+		Download a response to save_path through a temporary file.
+
+		The body goes to save_path + '.part', which gets the remote
+		Last-Modified time and only then replaces save_path. An interrupted
+		download therefore never leaves a file that If-Modified-Since would
+		report as up to date.
+
+		Args:
+			response (requests.Response): Streaming response to read from
+			save_path (str): Path where to save the file
+			show_progress (bool): Whether to show a progress bar for large files
+		"""
+		part_path = save_path + '.part'
+		try:
+			self._write_response(response, part_path, show_progress, os.path.basename(save_path))
+			self._set_modified_time(part_path, response.headers.get('Last-Modified'))
+			os.replace(part_path, save_path)
+		except BaseException:
+			try:
+				os.remove(part_path)
+			except OSError:
+				pass
+			raise
+
+	@staticmethod
+	def _set_modified_time(save_path: str, last_modified: str):
+		"""
+		Set a file's modification time to match the remote Last-Modified header.
+
+		Args:
+			save_path (str): Path of the downloaded file
+			last_modified (str): Value of the Last-Modified header, if any
+		"""
+		timestamp = _parse_http_date(last_modified)
+		if timestamp:
 			try:
-				dt = parsedate_to_datetime(last_modified)
-				timestamp = dt.timestamp()
 				os.utime(save_path, (timestamp, timestamp))
 			except Exception:
 				pass
 
 class IntraAPI:
-	def __init__(self, uid, secret):
+	# Tokens shared by all instances of the process: sha256(uid:secret) -> (token, monotonic expiry)
+	_token_cache = {}
+
+	def __init__(self, uid, secret, force_refresh=False, token_cache_path=_DEFAULT):
+		"""
+		Args:
+			uid (str): OAuth2 application UID
+			secret (str): OAuth2 application secret
+			force_refresh (bool, optional): Ignore the token cached on disk and
+			                                request a new one. Defaults to False.
+			token_cache_path (str, optional): File the token is cached in across runs;
+			                                  None keeps it in this process only.
+			                                  Defaults to TOKEN_CACHE_PATH.
+		"""
 		self.uid = uid
 		self.secret = secret
+		self.token_cache_path = TOKEN_CACHE_PATH if token_cache_path is _DEFAULT else token_cache_path
 		self.url = "https://api.intra.42.fr"
 		self.headers = {
 			'Content-Type': 'application/x-www-form-urlencoded'
 		}
 		self.token = None
-		self.get_token()
+		# Whether the token came from a cache and may have been revoked since
+		self._token_from_cache = False
+		self._token_lock = threading.Lock()
+		# Keep-alive connections are reused across token, page and prefetch requests
+		self.session = requests.Session()
+		self.session.headers.update(self.headers)
+		adapter = HTTPAdapter(
+			pool_connections=10,
+			pool_maxsize=20,
+			# Throttled (429) and failed (5xx) requests are retried, honouring Retry-After
+			max_retries=Retry(
+				total=3,
+				backoff_factor=0.3,
+				status_forcelist=[429, 500, 502, 503, 504],
+				raise_on_status=False
+			)
+		)
+		self.session.mount('https://', adapter)
+		# Single background thread used by get_paginated() to prefetch the next page
+		self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+		self.get_token(force_refresh=force_refresh)
 	
 	def get(self, endpoint, params=None, page=None, page_size=30):
 		"""
@@ -339,68 +1168,279 @@ class IntraAPI:
 			page (int, optional): Page number for pagination. Defaults to None.
 			page_size (int, optional): Number of items per page. Defaults to 30.
 		"""
-		if params is None:
-			params = {}
-		params = params.copy()
+		response = self._get_response(endpoint, params=params, page=page, page_size=page_size)
+		return self._decode_json(response, endpoint)
+
+	def _get_response(self, endpoint, params=None, page=None, page_size=30):
+		"""
+		Helper method performing the GET request of get(), returning the raw response
+
+		Args:
+			endpoint (str): API endpoint
+			params (dict, optional): Query parameters. Defaults to {}.
+			page (int, optional): Page number for pagination. Defaults to None.
+			page_size (int, optional): Number of items per page. Defaults to 30.
+		Returns:
+			requests.Response: Response of a successful request
+		"""
 		if page is not None:
-			params['page[number]'] = page
-			params['page[size]'] = page_size
-		if self.token:
-			self.headers['Authorization'] = 'Bearer ' + self.token
-		response = requests.get(
-			self.url + endpoint, 
-			headers=self.headers, 
-			params=params
-		)
+			params = {**(params or {}), 'page[number]': page, 'page[size]': page_size}
+		# Without params, skip the query string encoding entirely
+		kwargs = {'params': params} if params else {}
+		token = self.token
+		response = self.session.get(self.url + endpoint, **kwargs)
+		if response.status_code == 401 and self._token_from_cache:
+			# A cached token may have been revoked since it was stored: replace it once
+			self._replace_rejected_token(token)
+			response = self.session.get(self.url + endpoint, **kwargs)
 		response.raise_for_status()
+		return response
+
+	@staticmethod
+	def _decode_json(response, endpoint):
+		"""
+		Helper method decoding a response body as JSON
+
+		Args:
+			response (requests.Response): API response
+			endpoint (str): API endpoint, for the error message
+		"""
 		try:
-			return response.json()
-		except requests.JSONDecodeError:
+			# Decoding the raw bytes skips building an intermediate str of the body
+			return _json_loads(response.content)
+		except ValueError:
 			raise Exception(f"Invalid JSON response from {endpoint}")
 
-	def get_paginated(self, endpoint, params=None, page_size=100):
+	def get_paginated(self, endpoint, params=None, page_size=100, start_page=1):
 		"""
 		Generator to get all items from a paginated endpoint
 
+		Stops when a page has no Link rel="next"; responses without a Link
+		header stop at the first page shorter than page_size.
+
 		Args:
 			endpoint (str): API endpoint
 			params (dict, optional): Query parameters. Defaults to {}.
 			page_size (int, optional): Number of items per page. Defaults to 100.
+			start_page (int, optional): First page to fetch. Defaults to 1.
 		Yields:
 			dict: Individual items from the paginated response
 		"""
 		if params is None:
 			params = {}
-		params = params.copy()
-		page = 1
-		while True:
-			params['page[number]'] = page
-			params['page[size]'] = page_size
-			results = self.get(endpoint, params=params)
+
+		def fetch(page):
+			page_params = {**params, 'page[number]': page, 'page[size]': page_size}
+			return self._prefetch_executor.submit(self._get_response, endpoint, params=page_params)
+
+		page = start_page
+		next_page = fetch(page)
+		while next_page is not None:
+			response = next_page.result()
+			results = self._decode_json(response, endpoint)
 			if not results:
 				break
+			# Request the following page before handing items to the caller,
+			# so its round trip overlaps with the caller's processing
+			next_page = None
+			if _has_next_page(response, results, page_size):
+				page += 1
+				next_page = fetch(page)
 			for item in results:
 				yield item
-			if len(results) < page_size:
-				break
-			page += 1
 	
-	def get_all_pages(self, endpoint, params={}, page_size=100):
-		return list(self.get_paginated(endpoint, params=params, page_size=page_size))
-
-	def post(self, endpoint, payload={}):
-		if self.token:
-			self.headers['Authorization'] = 'Bearer ' + self.token
-		response = requests.post(
-			self.url + endpoint, 
-			headers=self.headers, 
-			data=payload
-		)
+	def get_all_pages(self, endpoint, params=None, page_size=100, max_workers=2, parallel=False):
+		"""
+		Get all items from a paginated endpoint as a list
+
+		Pages are walked one by one like get_paginated(). With parallel=True,
+		the first page's Link (rel="last") or X-Total header tells how many
+		pages there are, and the remaining ones are fetched concurrently.
+
+		max_workers caps the requests in flight, not their rate: the API allows
+		2 requests per second per application by default, which even two
+		concurrent requests can exceed. Throttled requests (429) are retried
+		after the server's Retry-After delay, so parallel fetching trades those
+		waits for fewer round trips.
+
+		Args:
+			endpoint (str): API endpoint
+			params (dict, optional): Query parameters. Defaults to {}.
+			page_size (int, optional): Number of items per page. Defaults to 100.
+			max_workers (int, optional): Maximum concurrent requests. Defaults to 2.
+			parallel (bool, optional): Fetch the remaining pages concurrently. Defaults to False.
+		Returns:
+			list[dict]: All items, in page order
+		"""
+		response = self._get_response(endpoint, params=params, page=1, page_size=page_size)
+		items = list(self._decode_json(response, endpoint) or [])
+		last_page = None
+		if parallel:
+			last_page = _last_page_from_links(response)
+			if last_page is None:
+				last_page = _last_page_from_total(response, page_size)
+
+		if last_page is None:
+			# Page count unknown (or sequential mode): walk the remaining pages one by one
+			if items and _has_next_page(response, items, page_size):
+				items.extend(self.get_paginated(endpoint, params=params, page_size=page_size, start_page=2))
+			return items
+
+		if last_page > 1:
+			def fetch(page):
+				return self.get(endpoint, params=params, page=page, page_size=page_size)
+
+			with ThreadPoolExecutor(max_workers=max(1, min(max_workers, last_page - 1))) as executor:
+				for page_items in executor.map(fetch, range(2, last_page + 1)):
+					items.extend(page_items)
+		return items
+
+	def post(self, endpoint, payload=None):
+		response = self.session.post(self.url + endpoint, data=payload)
 		return response.json()
 
-	def get_token(self):
+	def get_token(self, force_refresh=False):
+		"""
+		Acquire an OAuth2 token, reusing a still valid one from memory or the token cache file
+
+		Args:
+			force_refresh (bool, optional): Skip the cache and request a new token.
+			                                Defaults to False.
+		"""
+		if not force_refresh:
+			cached = self._load_memory_token() or self._load_cached_token()
+			if cached:
+				self._set_token(cached)
+				self._token_from_cache = True
+				return
+		# Don't send a stale token to the token endpoint
+		self.session.headers.pop('Authorization', None)
 		oauth_response = self.post("/oauth/token", {"grant_type": "client_credentials", \
                             "client_id": self.uid, "client_secret": self.secret})
 		if not oauth_response.get("access_token"):
 			raise Exception(oauth_response.get("error_description"))
-		self.token = oauth_response["access_token"]
+		self._set_token(oauth_response["access_token"])
+		self._token_from_cache = False
+		if 'expires_in' in oauth_response:
+			IntraAPI._token_cache[self._token_cache_key()] = (
+				oauth_response["access_token"],
+				time.monotonic() + oauth_response['expires_in'] - 60
+			)
+		self._save_cached_token(oauth_response)
+
+	def _replace_rejected_token(self, rejected):
+		"""
+		Helper method dropping a cached token the API rejected and requesting a new one
+
+		Concurrent requests rejected with the same token share a single replacement.
+
+		Args:
+			rejected (str): Token sent with the rejected request
+		"""
+		with self._token_lock:
+			if self.token != rejected or not self._token_from_cache:
+				return
+			IntraAPI._token_cache.pop(self._token_cache_key(), None)
+			data = self._read_token_cache()
+			if data.pop(self._token_cache_key().hex(), None) is not None:
+				self._write_token_cache(data)
+			self.get_token(force_refresh=True)
+
+	def _set_token(self, token):
+		"""
+		Helper method storing the token and sending it with every session request
+
+		Args:
+			token (str): OAuth2 access token
+		"""
+		self.token = token
+		self.session.headers['Authorization'] = 'Bearer ' + token
+
+	def _token_cache_key(self):
+		"""
+		Helper method deriving the token cache key, so the secret isn't kept as plaintext
+
+		Keys the in-memory cache, and hex-encoded the cache file, so a token is
+		only reused with the credentials it was issued for.
+
+		Returns:
+			bytes: sha256 digest of uid:secret
+		"""
+		return hashlib.sha256(f"{self.uid}:{self.secret}".encode()).digest()
+
+	def _load_memory_token(self):
+		"""
+		Helper method returning a token acquired earlier in this process, if still valid
+
+		Returns:
+			str: Access token, or None if there is no usable token in memory
+		"""
+		entry = IntraAPI._token_cache.get(self._token_cache_key())
+		if entry and time.monotonic() < entry[1]:
+			return entry[0]
+		return None
+
+	def _read_token_cache(self):
+		"""
+		Helper method reading the token cache file
+
+		Returns:
+			dict: Cached token entries keyed by hex sha256(uid:secret), empty if unavailable
+		"""
+		if self.token_cache_path is None:
+			return {}
+		try:
+			with open(self.token_cache_path) as f:
+				data = json.load(f)
+		except (OSError, ValueError):
+			return {}
+		return data if isinstance(data, dict) else {}
+
+	def _load_cached_token(self):
+		"""
+		Helper method returning these credentials' cached token if it is valid for at least another minute
+
+		Returns:
+			str: Access token, or None if there is no usable cached token
+		"""
+		entry = self._read_token_cache().get(self._token_cache_key().hex())
+		try:
+			if entry['created_at'] + entry['expires_in'] - 60 > time.time():
+				return entry['access_token']
+		except (KeyError, TypeError):
+			pass
+		return None
+
+	def _save_cached_token(self, oauth_response):
+		"""
+		Helper method storing a freshly acquired token in the cache file (owner-readable only)
+
+		Args:
+			oauth_response (dict): Response of the /oauth/token endpoint
+		"""
+		if 'expires_in' not in oauth_response or self.token_cache_path is None:
+			return
+		data = self._read_token_cache()
+		data[self._token_cache_key().hex()] = {
+			'access_token': oauth_response['access_token'],
+			'expires_in': oauth_response['expires_in'],
+			'created_at': oauth_response.get('created_at', time.time())
+		}
+		self._write_token_cache(data)
+
+	def _write_token_cache(self, data):
+		"""
+		Helper method replacing the token cache file (owner-readable only)
+
+		Args:
+			data (dict): Cached token entries keyed by hex sha256(uid:secret)
+		"""
+		try:
+			os.makedirs(os.path.dirname(self.token_cache_path), exist_ok=True)
+			tmp_path = self.token_cache_path + '.tmp'
+			with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as f:
+				json.dump(data, f)
+			os.replace(tmp_path, self.token_cache_path)
+		except OSError:
+			# Caching is best-effort; the token itself is already acquired
+			pass
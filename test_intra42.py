@@ -1,139 +1,481 @@
+import copy
+import hashlib
+import json
+import math
+import os
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock, patch, MagicMock, call
+import intra42
 from intra42 import IntraAPI, IntraScrape
 import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib.parse import parse_qs, urlsplit
+
+
+@lru_cache(maxsize=None)
+def _projects_html(projects, last_page=None):
+    """Project list page for a tuple of (name, url) pairs, with a "last page" link when last_page is given"""
+    items = ''.join(
+        f'<li class="project-item"><div class="project-name"><a href="{url}">{name}</a></div></li>'
+        for name, url in projects
+    )
+    page = f'<ul class="projects-list--list">{items}</ul>'
+    if last_page is not None:
+        page = (
+            f'<div id="projects-list-container">{page}'
+            f'<div><ul><li class="last"><a href="/projects/list?page={last_page}">Last</a></li></ul></div></div>'
+        )
+    return f'<html><body>{page}</body></html>'.encode()
+
+
+# Canned pages, built once at import and shared by the scraper tests
+_HTML_SINGLE_PROJECT = _projects_html((('Libft', '/projects/libft'),))
+
+_HTML_TWO_PROJECTS = _projects_html((('Libft', '/projects/libft'), ('ft_printf', '/projects/ft_printf')))
+
+_HTML_ATTACHMENTS = b'''
+    <html>
+        <h4 class="attachment-name">
+            <a href="/uploads/subject.pdf">en.subject.pdf</a>
+        </h4>
+        <h4 class="attachment-name">
+            <a href="/uploads/guide.pdf">guide.pdf</a>
+        </h4>
+    </html>
+'''
+
+_HTML_NO_PROJECTS = b'<html><body>No projects list here</body></html>'
+
+_HTML_LAST_PAGE_17 = _projects_html((), last_page=17)
+
+# Encoded API page bodies, shared by the pagination tests
+_JSON_EMPTY_PAGE = b'[]'
+_PAGINATED_PAGES = (b'[{"id": 1}, {"id": 2}]', b'[{"id": 3}]')
+_JSON_FULL_LAST_PAGE = b'[{"id": 3}, {"id": 4}]'
+
+_CANNED_PAGES = frozenset({
+    _HTML_SINGLE_PROJECT, _HTML_TWO_PROJECTS, _HTML_ATTACHMENTS, _HTML_NO_PROJECTS, _HTML_LAST_PAGE_17
+})
+
+# Read-only cookie sets shared by the scraper tests; IntraScrape only copies them into its session
+_COOKIES = MappingProxyType({'session': 'test'})
+_NO_COOKIES = MappingProxyType({})
+
+_parse_html = intra42._parse_html
+
+
+@lru_cache(maxsize=8)
+def _parsed_page(html, encoding):
+    """Parse a canned page once per run; the scraper only reads the trees"""
+    return _parse_html(html, encoding)
+
+
+class _Response(SimpleNamespace):
+    """Streaming response stub; dunders must live on the class for `with` to find them"""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def close(self):
+        pass
+
+    def iter_content(self, chunk_size=None):
+        self.chunk_sizes.append(chunk_size)
+        return iter(self.chunks)
+
+
+def _resp(status=200, headers=None, chunks=()):
+    """Build a plain response stub instead of a Mock with auto-spawned attributes"""
+    return _Response(status_code=status, headers=headers or {}, chunks=list(chunks), chunk_sizes=[])
+
+
+def _time_shifted(seconds):
+    """Stand-in for intra42's `time` module with a clock `seconds` ahead; the real time.monotonic stays untouched"""
+    return SimpleNamespace(monotonic=lambda: time.monotonic() + seconds, time=time.time, sleep=time.sleep)
+
+
+def _api_page(content, links=None, headers=None):
+    """Successful API response stub carrying an encoded page"""
+    return SimpleNamespace(status_code=200, content=content, links=links or {}, headers=headers or {},
+                           raise_for_status=lambda: None)
+
+
+class FakeAdapter(BaseAdapter):
+    """Transport adapter answering from canned responses, so the real Session code path runs"""
+
+    def __init__(self):
+        super().__init__()
+        self.routes = {}
+        self.calls = []
+
+    def add(self, method, url, json=None, status=200, headers=None, body=None):
+        """Queue a response for method + url (query string ignored; the last one repeats); raw `body` bytes win over `json`"""
+        self.routes.setdefault((method, url), []).append((status, json, headers or {}, body))
+
+    def send(self, request, **kwargs):
+        self.calls.append(request)
+        url = request.url.split('?')[0]
+        queued = self.routes[(request.method, url)]
+        status, payload, headers, body = queued.pop(0) if len(queued) > 1 else queued[0]
+
+        response = requests.Response()
+        response.status_code = status
+        if body is None:
+            response.headers = CaseInsensitiveDict({'Content-Type': 'application/json', **headers})
+            response._content = json.dumps(payload).encode()
+        else:
+            response.headers = CaseInsensitiveDict({'Content-Type': 'text/html; charset=utf-8', **headers})
+            response._content = body
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope='module')
+def api(tmp_path_factory):
+    """Pre-authenticated IntraAPI shared by the tests that only exercise GET requests"""
+    token_path = tmp_path_factory.mktemp('token') / 'token.json'
+    with patch('intra42.requests.Session.post') as mock_post, \
+            patch('intra42.TOKEN_CACHE_PATH', str(token_path)), \
+            patch.dict(IntraAPI._token_cache, clear=True):
+        mock_post.return_value.json.return_value = {'access_token': 'token'}
+        instance = IntraAPI('uid', 'secret')
+    yield instance
+
+
+@pytest.fixture
+def cached_parse(monkeypatch):
+    """Serve the canned pages from _parsed_page; any other HTML is parsed as usual"""
+    def parse(html, encoding=None):
+        if html in _CANNED_PAGES:
+            return _parsed_page(html, encoding)
+        return _parse_html(html, encoding)
+
+    monkeypatch.setattr('intra42._parse_html', parse)
+
+
+@pytest.fixture(scope='module')
+def shared_scraper():
+    """One IntraScrape (and session) for the whole module, with a snapshot of its initial state"""
+    instance = IntraScrape(_COOKIES)
+    state = {name: value for name, value in vars(instance).items() if name != 'session'}
+    return instance, state
+
+
+@pytest.fixture
+def scraper(shared_scraper):
+    """The module's IntraScrape, reset to its initial state for each test"""
+    instance, state = shared_scraper
+    instance.__dict__.update(copy.deepcopy(state))
+    return instance
 
 
 class TestIntraAPI:
     """Tests for the IntraAPI class"""
 
-    @patch('intra42.requests.post')
-    def test_token_acquisition_success(self, mock_post):
+    @pytest.fixture(autouse=True)
+    def token_cache(self, tmp_path, monkeypatch):
+        """Keep the OAuth2 token cache out of the user's home directory"""
+        path = tmp_path / 'token.json'
+        monkeypatch.setattr('intra42.TOKEN_CACHE_PATH', str(path))
+        monkeypatch.setattr(IntraAPI, '_token_cache', {})
+        return path
+
+    @pytest.fixture
+    def http_mocks(self, monkeypatch):
+        """Mocks for Session.post and Session.get, configured per test by attribute assignment"""
+        post, get = Mock(), Mock()
+        monkeypatch.setattr('intra42.requests.Session.post', post)
+        monkeypatch.setattr('intra42.requests.Session.get', get)
+        return SimpleNamespace(post=post, get=get)
+
+    @pytest.fixture
+    def api_adapter(self, monkeypatch):
+        """Serve the API from a FakeAdapter mounted on every session IntraAPI creates"""
+        adapter = FakeAdapter()
+        adapter.add('POST', 'https://api.intra.42.fr/oauth/token', json={'access_token': 'token'})
+        session_class = requests.Session
+
+        def make_session():
+            session = session_class()
+            # More specific than the https:// pool IntraAPI mounts, so it takes precedence
+            session.mount('https://api.intra.42.fr/', adapter)
+            return session
+
+        # requests.get() & co. build their sessions internally, so they would bypass the adapter
+        monkeypatch.setattr('intra42.requests.Session', make_session)
+        return adapter
+
+    def test_token_acquisition_success(self, http_mocks):
         """Test successful OAuth2 token acquisition"""
         mock_response = Mock()
         mock_response.json.return_value = {
             'access_token': 'test_token_123',
             'expires_in': 7200
         }
-        mock_post.return_value = mock_response
+        http_mocks.post.return_value = mock_response
 
         api = IntraAPI('test_uid', 'test_secret')
 
         assert api.token == 'test_token_123'
-        mock_post.assert_called_once()
+        http_mocks.post.assert_called_once()
 
-    @patch('intra42.requests.post')
-    def test_token_acquisition_failure(self, mock_post):
+    def test_token_acquisition_failure(self, http_mocks):
         """Test failed OAuth2 token acquisition"""
         mock_response = Mock()
         mock_response.json.return_value = {
             'error': 'invalid_client',
             'error_description': 'Invalid client credentials'
         }
-        mock_post.return_value = mock_response
+        http_mocks.post.return_value = mock_response
 
         with pytest.raises(Exception, match='Invalid client credentials'):
             IntraAPI('bad_uid', 'bad_secret')
 
-    @patch('intra42.requests.post')
-    @patch('intra42.requests.get')
-    def test_get_without_pagination(self, mock_get, mock_post):
-        """Test GET request without pagination parameters"""
-        # Mock token acquisition
-        mock_post_response = Mock()
-        mock_post_response.json.return_value = {'access_token': 'token'}
-        mock_post.return_value = mock_post_response
+    def test_session_connection_pool(self, http_mocks):
+        """Test IntraAPI reuses one pooled session that carries the token"""
+        http_mocks.post.return_value.json.return_value = {'access_token': 'token'}
+
+        api = IntraAPI('uid', 'secret')
+
+        adapter = api.session.get_adapter('https://api.intra.42.fr')
+        assert adapter._pool_maxsize == 20
+        assert adapter.max_retries.total == 3
+        assert 429 in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.respect_retry_after_header
+        assert api.session.headers['Authorization'] == 'Bearer token'
+        assert api.session.headers['Content-Type'] == 'application/x-www-form-urlencoded'
+
+    def test_token_cached_on_disk(self, http_mocks, token_cache):
+        """Test a valid token is reused from disk instead of requested again"""
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            'access_token': 'test_token_123',
+            'expires_in': 7200,
+            'created_at': time.time()
+        }
+        http_mocks.post.return_value = mock_response
+
+        IntraAPI('test_uid', 'test_secret')
+        api = IntraAPI('test_uid', 'test_secret')
+
+        assert api.token == 'test_token_123'
+        http_mocks.post.assert_called_once()
+        assert json.loads(token_cache.read_text())[api._token_cache_key().hex()]['access_token'] == 'test_token_123'
+        assert token_cache.stat().st_mode & 0o777 == 0o600
+
+        # force_refresh bypasses the cache
+        IntraAPI('test_uid', 'test_secret', force_refresh=True)
+        assert http_mocks.post.call_count == 2
+
+    def test_token_cache_checks_secret(self, http_mocks, token_cache):
+        """Test a token cached on disk isn't reused with a different secret"""
+        http_mocks.post.return_value.json.return_value = {'access_token': 'test_token_123', 'expires_in': 7200}
+        IntraAPI('test_uid', 'test_secret')
+        IntraAPI._token_cache.clear()  # only the disk cache is left
+
+        http_mocks.post.return_value.json.return_value = {'error_description': 'Invalid client credentials'}
+        with pytest.raises(Exception, match='Invalid client credentials'):
+            IntraAPI('test_uid', 'rotated_secret')
+        assert http_mocks.post.call_count == 2
+
+    def test_token_cache_disabled(self, http_mocks, token_cache):
+        """Test token_cache_path=None keeps the token out of the cache file"""
+        http_mocks.post.return_value.json.return_value = {'access_token': 'test_token_123', 'expires_in': 7200}
+
+        IntraAPI('uid', 'secret', token_cache_path=None)
+        api = IntraAPI('uid', 'secret', token_cache_path=None)
+
+        assert api.token == 'test_token_123'
+        assert http_mocks.post.call_count == 1  # still shared in memory
+        assert not token_cache.exists()
+
+    def test_rejected_cached_token_replaced(self, api_adapter, token_cache):
+        """Test a cached token the API rejects is dropped, replaced once, and the request retried"""
+        key = hashlib.sha256(b'uid:secret').hexdigest()
+        token_cache.write_text(json.dumps({
+            key: {'access_token': 'revoked', 'expires_in': 7200, 'created_at': time.time()}
+        }))
+        api_adapter.add('GET', 'https://api.intra.42.fr/v2/users/1', status=401, json={})
+        api_adapter.add('GET', 'https://api.intra.42.fr/v2/users/1', json={'id': 1})
+
+        api = IntraAPI('uid', 'secret')
+        assert api.token == 'revoked'
+        result = api.get('/v2/users/1')
+
+        assert result == {'id': 1}
+        rejected, token_request, retried = api_adapter.calls
+        assert rejected.headers['Authorization'] == 'Bearer revoked'
+        assert token_request.method == 'POST'
+        assert retried.headers['Authorization'] == 'Bearer token'
+        assert key not in json.loads(token_cache.read_text())
+
+    def test_rejected_fresh_token_not_retried(self, api_adapter):
+        """Test a 401 for a token just requested is raised without another token request"""
+        api_adapter.add('GET', 'https://api.intra.42.fr/v2/users/1', status=401, json={})
+
+        api = IntraAPI('uid', 'secret')
+        with pytest.raises(requests.exceptions.HTTPError):
+            api.get('/v2/users/1')
+
+        assert [request.method for request in api_adapter.calls] == ['POST', 'GET']
+
+    def test_token_cached_across_instances(self, http_mocks, token_cache):
+        """Test a second instance reuses the in-process token without a POST"""
+        http_mocks.post.return_value.json.return_value = {'access_token': 'test_token_123', 'expires_in': 7200}
+
+        IntraAPI('uid', 'secret')
+        token_cache.unlink()  # only the in-memory cache is left
+        api = IntraAPI('uid', 'secret')
+
+        assert api.token == 'test_token_123'
+        assert http_mocks.post.call_count == 1
+
+    def test_token_refresh_on_expiry(self, http_mocks, token_cache, monkeypatch):
+        """Test an expired in-process token is requested again"""
+        http_mocks.post.return_value.json.return_value = {'access_token': 'test_token_123', 'expires_in': 7200}
+
+        IntraAPI('uid', 'secret')
+        token_cache.unlink()
+        monkeypatch.setattr('intra42.time', _time_shifted(7200))
+        IntraAPI('uid', 'secret')
+
+        assert http_mocks.post.call_count == 2
+
+    def test_token_cache_expired(self, http_mocks, token_cache):
+        """Test an expired cached token is replaced"""
+        key = hashlib.sha256(b'test_uid:test_secret').hexdigest()
+        token_cache.write_text(json.dumps({
+            key: {'access_token': 'old_token', 'expires_in': 7200, 'created_at': time.time() - 7200}
+        }))
+        mock_response = Mock()
+        mock_response.json.return_value = {'access_token': 'new_token', 'expires_in': 7200}
+        http_mocks.post.return_value = mock_response
+
+        api = IntraAPI('test_uid', 'test_secret')
 
-        # Mock GET request
-        mock_get_response = Mock()
-        mock_get_response.json.return_value = {'id': 1, 'name': 'test'}
-        mock_get.return_value = mock_get_response
+        assert api.token == 'new_token'
+        http_mocks.post.assert_called_once()
+
+    def test_get_without_pagination(self, api_adapter):
+        """Test GET request without pagination parameters"""
+        api_adapter.add('GET', 'https://api.intra.42.fr/v2/users/1', json={'id': 1, 'name': 'test'})
 
         api = IntraAPI('uid', 'secret')
         result = api.get('/v2/users/1')
 
         assert result == {'id': 1, 'name': 'test'}
-        # Check Authorization header was set
-        call_kwargs = mock_get.call_args.kwargs
-        assert 'Authorization' in call_kwargs['headers']
-        assert call_kwargs['headers']['Authorization'] == 'Bearer token'
-
-    @patch('intra42.requests.post')
-    @patch('intra42.requests.get')
-    def test_get_with_pagination(self, mock_get, mock_post):
+        # Token and GET went through the same session; the token is sent with the GET only
+        token_request, get_request = api_adapter.calls
+        assert 'Authorization' not in token_request.headers
+        assert get_request.headers['Authorization'] == 'Bearer token'
+        assert get_request.url == 'https://api.intra.42.fr/v2/users/1'
+
+    def test_get_invalid_json(self, http_mocks, api):
+        """Test a non-JSON body raises a readable error"""
+        http_mocks.get.return_value = _api_page(b'<html>Bad Gateway</html>')
+
+        with pytest.raises(Exception, match='Invalid JSON response from /v2/users'):
+            api.get('/v2/users')
+
+    def test_get_does_not_mutate_shared_state(self, http_mocks, api):
+        """Test GET leaves the caller's params and the base headers untouched"""
+        http_mocks.get.return_value = _api_page(_JSON_EMPTY_PAGE)
+
+        params = {'filter[campus_id]': 1}
+        api.get('/v2/users', params=params, page=2)
+        api.get('/v2/users', params=params, page=3)
+
+        assert params == {'filter[campus_id]': 1}
+        assert 'Authorization' not in api.headers
+        first, second = http_mocks.get.call_args_list
+        assert first.kwargs['params']['page[number]'] == 2
+        assert second.kwargs['params']['page[number]'] == 3
+
+    def test_get_with_pagination(self, api_adapter):
         """Test GET request with pagination parameters"""
-        # Mock token acquisition
-        mock_post_response = Mock()
-        mock_post_response.json.return_value = {'access_token': 'token'}
-        mock_post.return_value = mock_post_response
-
-        # Mock GET request
-        mock_get_response = Mock()
-        mock_get_response.json.return_value = [{'id': 1}, {'id': 2}]
-        mock_get.return_value = mock_get_response
+        api_adapter.add('GET', 'https://api.intra.42.fr/v2/users', json=[{'id': 1}, {'id': 2}])
 
         api = IntraAPI('uid', 'secret')
         result = api.get('/v2/users', page=2, page_size=50)
 
+        assert result == [{'id': 1}, {'id': 2}]
         # Check pagination params were added
-        call_kwargs = mock_get.call_args.kwargs
-        assert call_kwargs['params']['page[number]'] == 2
-        assert call_kwargs['params']['page[size]'] == 50
+        query = parse_qs(urlsplit(api_adapter.calls[-1].url).query)
+        assert query['page[number]'] == ['2']
+        assert query['page[size]'] == ['50']
 
-    @patch('intra42.requests.post')
-    @patch('intra42.requests.get')
-    def test_get_paginated_generator(self, mock_get, mock_post):
+    def test_get_paginated_generator(self, api_adapter):
         """Test get_paginated generator yields all items"""
-        # Mock token acquisition
-        mock_post_response = Mock()
-        mock_post_response.json.return_value = {'access_token': 'token'}
-        mock_post.return_value = mock_post_response
-
-        # Mock paginated responses
-        mock_get.return_value.json.side_effect = [
-            [{'id': 1}, {'id': 2}],  # Page 1 (full page)
-            [{'id': 3}],  # Page 2 (partial page - triggers stop)
-        ]
+        # Only page 1 links to a next page
+        api_adapter.add('GET', 'https://api.intra.42.fr/v2/users', json=[{'id': 1}, {'id': 2}],
+                        headers={'Link': '<https://api.intra.42.fr/v2/users?page%5Bnumber%5D=2>; rel="next"'})
+        api_adapter.add('GET', 'https://api.intra.42.fr/v2/users', json=[{'id': 3}],
+                        headers={'Link': '<https://api.intra.42.fr/v2/users?page%5Bnumber%5D=1>; rel="prev"'})
 
         api = IntraAPI('uid', 'secret')
         items = list(api.get_paginated('/v2/users', page_size=2))
 
         assert len(items) == 3
         assert items == [{'id': 1}, {'id': 2}, {'id': 3}]
-        assert mock_get.call_count == 2
+        assert [request.method for request in api_adapter.calls] == ['POST', 'GET', 'GET']
 
-    @patch('intra42.requests.post')
-    @patch('intra42.requests.get')
-    def test_get_paginated_empty_response(self, mock_get, mock_post):
-        """Test get_paginated handles empty response"""
-        # Mock token acquisition
-        mock_post_response = Mock()
-        mock_post_response.json.return_value = {'access_token': 'token'}
-        mock_post.return_value = mock_post_response
+    def test_get_paginated_exact_page_size(self, http_mocks, api):
+        """Test a full last page without rel="next" ends pagination without another request"""
+        http_mocks.get.side_effect = (
+            _api_page(_PAGINATED_PAGES[0], links={'next': {'url': 'https://api.intra.42.fr/v2/users?page%5Bnumber%5D=2'}}),
+            _api_page(_JSON_FULL_LAST_PAGE, links={'prev': {'url': 'https://api.intra.42.fr/v2/users?page%5Bnumber%5D=1'}}),
+        )
+
+        items = list(api.get_paginated('/v2/users', page_size=2))
+
+        assert [item['id'] for item in items] == [1, 2, 3, 4]
+        assert http_mocks.get.call_count == 2
+
+    def test_get_paginated_prefetches_next_page(self, http_mocks, api):
+        """Test get_paginated requests the next page before yielding the current one"""
+        # No Link header: a full page means there may be more
+        http_mocks.get.side_effect = tuple(map(_api_page, _PAGINATED_PAGES))
+
+        items = api.get_paginated('/v2/users', page_size=2)
+
+        assert next(items) == {'id': 1}
+        # Single prefetch worker runs jobs in order: page 2 is done once this returns
+        api._prefetch_executor.submit(lambda: None).result()
+        assert http_mocks.get.call_count == 2
+        assert http_mocks.get.call_args.kwargs['params']['page[number]'] == 2
+        assert list(items) == [{'id': 2}, {'id': 3}]
 
+    def test_get_paginated_empty_response(self, http_mocks, api):
+        """Test get_paginated handles empty response"""
         # Mock empty response
-        mock_get.return_value.json.return_value = []
+        http_mocks.get.return_value = _api_page(_JSON_EMPTY_PAGE)
 
-        api = IntraAPI('uid', 'secret')
         items = list(api.get_paginated('/v2/users'))
 
         assert items == []
-        assert mock_get.call_count == 1
+        assert http_mocks.get.call_count == 1
 
-    @patch('intra42.requests.post')
-    @patch('intra42.requests.get')
-    def test_get_all_pages(self, mock_get, mock_post):
+    def test_get_all_pages(self, api_adapter):
         """Test get_all_pages returns complete list"""
-        # Mock token acquisition
-        mock_post_response = Mock()
-        mock_post_response.json.return_value = {'access_token': 'token'}
-        mock_post.return_value = mock_post_response
-
-        # Mock paginated responses
-        mock_get.return_value.json.side_effect = [
-            [{'id': 1}, {'id': 2}],
-            [{'id': 3}],
-        ]
+        # Paginated responses without a Link or X-Total header
+        api_adapter.add('GET', 'https://api.intra.42.fr/v2/users', json=[{'id': 1}, {'id': 2}])
+        api_adapter.add('GET', 'https://api.intra.42.fr/v2/users', json=[{'id': 3}])
 
         api = IntraAPI('uid', 'secret')
         items = api.get_all_pages('/v2/users', page_size=2)
@@ -141,247 +483,322 @@ class TestIntraAPI:
         assert isinstance(items, list)
         assert len(items) == 3
 
-    @patch('intra42.requests.post')
-    def test_params_not_shared_between_calls(self, mock_post):
-        """Test that mutable default params don't cause issues"""
-        # This test would fail with the current implementation
-        # It's here to demonstrate the bug with mutable default arguments
-        mock_response = Mock()
-        mock_response.json.return_value = {'access_token': 'token'}
-        mock_post.return_value = mock_response
+    def test_get_all_pages_parallel(self, http_mocks, api):
+        """Test get_all_pages fetches the pages after the first in parallel"""
+        def get_side_effect(url, params):
+            page = params['page[number]']
+            return _api_page(
+                json.dumps([{'id': page * 10}, {'id': page * 10 + 1}]).encode(),
+                links={'last': {'url': 'https://api.intra.42.fr/v2/users?page%5Bnumber%5D=3&page%5Bsize%5D=2'}}
+            )
+
+        http_mocks.get.side_effect = get_side_effect
 
-        # Note: This test documents a known issue with mutable defaults
-        # The actual fix requires changing the code
+        items = api.get_all_pages('/v2/users', page_size=2, parallel=True)
+
+        assert [item['id'] for item in items] == [10, 11, 20, 21, 30, 31]
+        assert http_mocks.get.call_count == 3
+
+    def test_get_all_pages_parallel_x_total(self, http_mocks, api):
+        """Test get_all_pages derives the page count from X-Total and fetches concurrently"""
+        # Pages 2 and 3 only get past the barrier if they are in flight at the same time
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_side_effect(url, params):
+            page = params['page[number]']
+            if page > 1:
+                barrier.wait()
+            return _api_page(
+                json.dumps([{'id': i} for i in range((page - 1) * 2, min(page * 2, 5))]).encode(),
+                headers={'X-Total': '5'}
+            )
+
+        http_mocks.get.side_effect = get_side_effect
+
+        items = api.get_all_pages('/v2/users', page_size=2, parallel=True)
+
+        assert [item['id'] for item in items] == [0, 1, 2, 3, 4]
+        assert http_mocks.get.call_count == math.ceil(5 / 2)
+
+    def test_params_not_shared_between_calls(self, http_mocks, api):
+        """Test that pagination params of one call don't leak into the next"""
+        http_mocks.get.return_value = _api_page(_JSON_EMPTY_PAGE)
+
+        api.get('/x', page=1)
+        api.get('/y')
+
+        assert http_mocks.get.call_args_list[0].kwargs['params']['page[number]'] == 1
+        assert http_mocks.get.call_args.kwargs.get('params') is None
+
+    def test_import_does_not_load_lxml(self):
+        """Test importing intra42 for the API alone leaves lxml unloaded"""
+        code = 'import sys, intra42; assert "lxml" not in sys.modules'
+        subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(intra42.__file__), check=True)
 
 
 class TestIntraScrape:
     """Tests for the IntraScrape class"""
 
+    @pytest.fixture(autouse=True)
+    def session_cache(self, monkeypatch):
+        """Give every test fresh scraper sessions"""
+        monkeypatch.setattr(IntraScrape, '_sessions', {})
+
+    @pytest.fixture
+    def scraper_adapter(self, scraper):
+        """Serve projects.intra.42.fr from a FakeAdapter mounted on the shared scraper's session"""
+        adapter = FakeAdapter()
+        prefix = scraper.base_url + '/'
+        scraper.session.mount(prefix, adapter)
+        yield adapter
+        del scraper.session.adapters[prefix]
+
     def test_init(self):
         """Test IntraScrape initialization"""
-        cookies = {'session': 'test'}
-        scraper = IntraScrape(cookies)
+        scraper = IntraScrape(_COOKIES)
 
         assert scraper.base_url == "https://projects.intra.42.fr"
         assert scraper.all_projects == []
         assert scraper.session.cookies.get('session') == 'test'
 
-    @patch('intra42.requests.Session.get')
-    def test_get_project_list_success(self, mock_get):
+    def test_init_connection_pool(self):
+        """Test IntraScrape sizes and bounds its connection pool and retries transient errors"""
+        scraper = IntraScrape(_NO_COOKIES, pool_size=24)
+
+        adapter = scraper.session.get_adapter('https://projects.intra.42.fr')
+        assert adapter._pool_maxsize == 24
+        assert adapter._pool_block is True
+        assert adapter.max_retries.total == 5
+        assert 429 in adapter.max_retries.status_forcelist
+
+    def test_session_pool_shared(self):
+        """Test instances with equal cookies share one session and connection pool"""
+        first = IntraScrape({'session': 'a'})
+        second = IntraScrape({'session': 'a'})
+        other = IntraScrape({'session': 'b'})
+
+        assert first.session is second.session
+        assert first.session.get_adapter('https://projects.intra.42.fr') is \
+            second.session.get_adapter('https://projects.intra.42.fr')
+        assert other.session is not first.session
+        assert other.session.cookies.get('session') == 'b'
+
+    def test_session_factory(self):
+        """Test a custom session factory is used to build the session"""
+        factory = Mock(return_value=requests.Session())
+        scraper = IntraScrape(_NO_COOKIES, session_factory=factory)
+
+        factory.assert_called_once_with()
+        assert scraper.session is factory.return_value
+
+    def test_get_project_list_success(self, scraper_adapter, scraper, cached_parse):
         """Test _get_project_list successfully retrieves projects"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = '''
-            <html>
-                <ul class="projects-list--list">
-                    <li class="project-item">
-                        <div class="project-name">
-                            <a href="/projects/test">Test Project</a>
-                        </div>
-                    </li>
-                </ul>
-            </html>
-        '''
-        mock_get.return_value = mock_response
-
-        scraper = IntraScrape({})
+        scraper_adapter.add('GET', 'https://projects.intra.42.fr/projects/list', body=_HTML_SINGLE_PROJECT)
+
         project_items = scraper._get_project_list()
 
         assert len(project_items) == 1
-        assert project_items[0].get('class') == ['project-item']
+        assert project_items[0].get('class') == 'project-item'
 
-    @patch('intra42.requests.Session.get')
-    def test_get_project_list_http_error(self, mock_get):
+    def test_get_project_list_http_error(self, scraper_adapter, scraper):
         """Test _get_project_list handles HTTP errors"""
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_get.return_value = mock_response
-
-        scraper = IntraScrape({})
+        scraper_adapter.add('GET', 'https://projects.intra.42.fr/projects/list', status=403, body=b'')
 
         with pytest.raises(Exception, match='Failed to retrieve projects: 403'):
             scraper._get_project_list()
 
-    @patch('intra42.requests.Session.get')
-    def test_get_project_list_no_projects_found(self, mock_get):
+    def test_get_project_list_no_projects_found(self, scraper_adapter, scraper):
         """Test _get_project_list when projects list is missing"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = '<html><body>No projects list here</body></html>'
-        mock_get.return_value = mock_response
-
-        scraper = IntraScrape({})
+        scraper_adapter.add('GET', 'https://projects.intra.42.fr/projects/list', body=_HTML_NO_PROJECTS)
 
         # Should return empty list when no projects found, not raise exception
         results = scraper._get_project_list_page(1)
         assert results == []
 
-    @patch('intra42.requests.Session.get')
-    def test_get_projects(self, mock_get):
-        """Test get_projects extracts project data correctly"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = '''
-            <html>
-                <ul class="projects-list--list">
-                    <li class="project-item">
-                        <div class="project-name">
-                            <a href="/projects/libft">Libft</a>
-                        </div>
-                    </li>
-                    <li class="project-item">
-                        <div class="project-name">
-                            <a href="/projects/ft_printf">ft_printf</a>
-                        </div>
-                    </li>
-                </ul>
-            </html>
-        '''
-        mock_get.return_value = mock_response
-
-        scraper = IntraScrape({})
-        projects = scraper.get_all_projects()
-
-        assert len(projects) == 2
-        assert projects[0] == {'name': 'Libft', 'url': '/projects/libft'}
-        assert projects[1] == {'name': 'ft_printf', 'url': '/projects/ft_printf'}
-        assert scraper.all_projects == projects
+    def test_parse_project_list_page_matches_class_tokens(self, scraper):
+        """Test project items are matched by whole class names, like CSS selectors"""
+        items = scraper._parse_project_list_page('''
+            <ul class="projects-list--list wide">
+                <li class="project-item active"><div class="project-name"><a href="/a">A</a></div></li>
+                <li class="project-item-placeholder"><div class="project-name"><a href="/b">B</a></div></li>
+            </ul>
+        ''')
+
+        assert [item.find('.//a').get('href') for item in items] == ['/a']
+
+    def test_parse_malformed_markup(self, scraper):
+        """Test selectors still match after lxml repairs unclosed tags"""
+        items = scraper._parse_project_list_page(b'''
+            <ul class="projects-list--list">
+                <li class="project-item"><div class="project-name"><a href="/a">A</div>
+                <li class="project-item"><div class="project-name"><a href="/b">B
+            </ul>
+        ''', 'utf-8')
+
+        assert [item.find('.//a').get('href') for item in items] == ['/a', '/b']
+        assert intra42._parse_attachment_html(b'<h4 class="attachment-name"><a href="/s.pdf">subject</h4><p>', 'utf-8') == ['/s.pdf']
+
+    def test_parse_project_list_page_decodes_bytes(self, scraper):
+        """Test raw page bytes are decoded with the response encoding"""
+        html = '<ul class="projects-list--list"><li class="project-item">Piscine Ñ</li></ul>'
+
+        items = scraper._parse_project_list_page(html.encode('utf-8'), 'utf-8')
+
+        assert items[0].text_content() == 'Piscine Ñ'
+
+    @pytest.mark.parametrize('html, method, args, expected', [
+        (_HTML_TWO_PROJECTS, 'get_all_projects', (), [
+            {'name': 'Libft', 'url': '/projects/libft'},
+            {'name': 'ft_printf', 'url': '/projects/ft_printf'}
+        ]),
+        (_HTML_SINGLE_PROJECT, 'get_project_url_by_name', ('libft',), '/projects/libft'),
+        (_HTML_SINGLE_PROJECT, 'get_project_url_by_name', ('nonexistent',), None),
+    ], ids=['get_all_projects', 'url_by_name', 'url_by_name_not_found'])
+    def test_project_lookups(self, scraper_adapter, scraper, html, method, args, expected, cached_parse):
+        """Test project data extraction and lookups on a scraped project list"""
+        scraper_adapter.add('GET', 'https://projects.intra.42.fr/projects/list', body=html)
+
+        result = getattr(scraper, method)(*args)
+
+        assert result == expected
+        # Every lookup loads the project list once and keeps it
+        assert scraper.all_projects and len(scraper_adapter.calls) == 1
+
+    @pytest.mark.parametrize('html, expected', [
+        (_HTML_ATTACHMENTS, ['/uploads/subject.pdf', '/uploads/guide.pdf']),
+        (b'<html><body>No attachments</body></html>', []),
+    ], ids=['found', 'none_found'])
+    @patch('intra42.tqdm.write')
+    def test_get_project_attachments(self, mock_write, scraper_adapter, scraper, html, expected, cached_parse):
+        """Test get_project_attachments extracts attachment links and reports projects without any"""
+        scraper_adapter.add('GET', 'https://projects.intra.42.fr/projects/libft', body=html)
 
-    @patch('intra42.requests.Session.get')
-    def test_get_project_attachments(self, mock_get):
-        """Test get_project_attachments extracts attachment links"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = '''
-            <html>
-                <h4 class="attachment-name">
-                    <a href="/uploads/subject.pdf">en.subject.pdf</a>
-                </h4>
-                <h4 class="attachment-name">
-                    <a href="/uploads/guide.pdf">guide.pdf</a>
-                </h4>
-            </html>
-        '''
-        mock_get.return_value = mock_response
-
-        scraper = IntraScrape({})
         attachments = scraper.get_project_attachments('/projects/libft')
 
-        assert len(attachments) == 2
-        assert attachments[0] == '/uploads/subject.pdf'
-        assert attachments[1] == '/uploads/guide.pdf'
+        assert attachments == expected
+        notices = [c.args[0] for c in mock_write.call_args_list]
+        if expected:
+            assert notices == []
+        else:
+            assert len(notices) == 1 and 'No attachments found' in notices[0]
+
+    @pytest.mark.parametrize('process_threshold', [50, 1])
+    def test_get_many_project_attachments(self, process_threshold, scraper_adapter, scraper):
+        """Test attachments of several projects are fetched and keyed by project URL"""
+        for name in ('libft', 'minishell'):
+            scraper_adapter.add('GET', f'https://projects.intra.42.fr/projects/{name}',
+                                body=f'<h4 class="attachment-name"><a href="/uploads/{name}.pdf">x</a></h4>'.encode())
+
+        attachments = scraper.get_many_project_attachments(
+            ['/projects/libft', '/projects/minishell'],
+            process_threshold=process_threshold
+        )
 
-    @patch('intra42.requests.Session.get')
-    def test_get_project_attachments_none_found(self, mock_get, capsys):
-        """Test get_project_attachments when no attachments exist"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = '<html><body>No attachments</body></html>'
-        mock_get.return_value = mock_response
+        assert attachments == {
+            '/projects/libft': ['/uploads/libft.pdf'],
+            '/projects/minishell': ['/uploads/minishell.pdf'],
+        }
 
-        scraper = IntraScrape({})
-        attachments = scraper.get_project_attachments('/projects/test')
+    @patch('intra42.os.replace')
+    @patch('intra42.requests.Session.get')
+    @patch('builtins.open', create=True)
+    def test_download_attachment(self, mock_open, mock_get, mock_replace, scraper):
+        """Test download_attachment writes a temporary file and moves it into place"""
+        mock_get.return_value = _resp(200, {'content-length': '500000'}, [b'chunk1', b'chunk2'])  # Small file (500KB), no progress bar
 
-        assert attachments == []
-        captured = capsys.readouterr()
-        assert 'No attachments found' in captured.out
+        mock_file = MagicMock()
+        mock_open.return_value.__enter__.return_value = mock_file
 
-    @patch('intra42.requests.Session.get')
-    def test_get_project_url_by_name(self, mock_get):
-        """Test get_project_url_by_name finds correct project"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = '''
-            <html>
-                <ul class="projects-list--list">
-                    <li class="project-item">
-                        <div class="project-name">
-                            <a href="/projects/libft">Libft</a>
-                        </div>
-                    </li>
-                </ul>
-            </html>
-        '''
-        mock_get.return_value = mock_response
-
-        scraper = IntraScrape({})
-        url = scraper.get_project_url_by_name('libft')
-
-        assert url == '/projects/libft'
+        scraper.download_attachment('/uploads/test.pdf', '/tmp/test.pdf', show_progress=False)
 
-    @patch('intra42.requests.Session.get')
-    def test_get_project_url_by_name_not_found(self, mock_get):
-        """Test get_project_url_by_name returns None for missing project"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = '''
-            <html>
-                <ul class="projects-list--list">
-                    <li class="project-item">
-                        <div class="project-name">
-                            <a href="/projects/libft">Libft</a>
-                        </div>
-                    </li>
-                </ul>
-            </html>
-        '''
-        mock_get.return_value = mock_response
-
-        scraper = IntraScrape({})
-        url = scraper.get_project_url_by_name('nonexistent')
-
-        assert url is None
+        # Verify file was written
+        assert mock_open.call_args.args[0] == '/tmp/test.pdf.part'
+        assert mock_file.write.call_args_list == [call(b'chunk1'), call(b'chunk2')]
+        mock_replace.assert_called_once_with('/tmp/test.pdf.part', '/tmp/test.pdf')
 
     @patch('intra42.requests.Session.get')
     @patch('builtins.open', create=True)
-    def test_download_attachment(self, mock_open, mock_get):
-        """Test download_attachment saves file correctly"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.headers = {'content-length': '500000'}  # Small file (500KB), no progress bar
-        mock_response.iter_content.return_value = [b'chunk1', b'chunk2']
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
-        mock_get.return_value = mock_response
+    def test_download_attachment_write_error(self, mock_open, mock_get, scraper):
+        """Test a failed disk write on the writer thread is raised to the caller"""
+        mock_get.return_value = _resp(200, {'content-length': '500000'}, [b'chunk1', b'chunk2', b'chunk3'])
 
         mock_file = MagicMock()
+        mock_file.write.side_effect = OSError('No space left on device')
         mock_open.return_value.__enter__.return_value = mock_file
 
-        scraper = IntraScrape({})
-        scraper.download_attachment('/uploads/test.pdf', '/tmp/test.pdf', show_progress=False)
+        with pytest.raises(OSError, match='No space left'):
+            scraper.download_attachment('/uploads/test.pdf', '/tmp/test.pdf', show_progress=False)
+        assert mock_file.write.call_count == 1
 
-        # Verify file was written
-        assert mock_file.write.call_count == 2
-        mock_file.write.assert_any_call(b'chunk1')
-        mock_file.write.assert_any_call(b'chunk2')
+    @patch('intra42.requests.Session.get')
+    @patch('builtins.open', create=True)
+    def test_download_attachment_304_not_modified(self, mock_open, mock_get, tmp_path, scraper):
+        """Test an existing file is revalidated with If-Modified-Since and kept on 304"""
+        save_path = tmp_path / 'test.pdf'
+        save_path.write_bytes(b'old')
+        os.utime(save_path, (1746792972.0, 1746792972.0))
+
+        mock_get.return_value = _resp(304)
+
+        downloaded = scraper.download_attachment('/uploads/test.pdf', str(save_path))
 
+        assert downloaded == False
+        assert mock_get.call_args.kwargs['headers']['If-Modified-Since'] == 'Fri, 09 May 2025 12:16:12 GMT'
+        mock_open.assert_not_called()
+
+    @patch('intra42.os.utime')
     @patch('intra42.requests.Session.get')
-    def test_download_attachment_http_error(self, mock_get):
-        """Test download_attachment handles HTTP errors"""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.headers = {'content-length': '0'}
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
-        mock_get.return_value = mock_response
+    def test_download_attachment_sets_mtime(self, mock_get, mock_utime, tmp_path, scraper):
+        """Test the downloaded file gets the remote Last-Modified time"""
+        mock_get.return_value = _resp(200, {'Last-Modified': 'Fri, 09 May 2025 12:16:12 GMT'}, [b'new'])
+
+        save_path = str(tmp_path / 'test.pdf')
+        downloaded = scraper.download_attachment('/uploads/test.pdf', save_path, show_progress=False)
 
-        scraper = IntraScrape({})
+        assert downloaded == True
+        assert mock_get.call_args.kwargs['headers'] == {}
+        # Set before the file is moved into place
+        mock_utime.assert_called_once_with(save_path + '.part', (1746792972.0, 1746792972.0))
+        assert os.listdir(tmp_path) == ['test.pdf']
+
+    @patch('intra42.os.posix_fallocate', create=True)
+    @patch('intra42.requests.Session.get')
+    def test_download_attachment_interrupted(self, mock_get, mock_fallocate, tmp_path, scraper):
+        """Test an interrupted download leaves no file behind, so the next call downloads again"""
+        def interrupted(chunk_size=None):
+            yield b'x' * 1024
+            raise requests.exceptions.ChunkedEncodingError('connection reset')
+
+        response = _resp(200, {'content-length': '5000000', 'Last-Modified': 'Fri, 09 May 2025 12:16:12 GMT'})
+        response.iter_content = interrupted
+        mock_get.return_value = response
+        save_path = str(tmp_path / 'large.pdf')
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            scraper.download_attachment('/uploads/large.pdf', save_path, show_progress=False)
+        assert os.listdir(tmp_path) == []
+
+        mock_get.return_value = _resp(200, {'Last-Modified': 'Fri, 09 May 2025 12:16:12 GMT'}, [b'complete'])
+        assert scraper.download_attachment('/uploads/large.pdf', save_path, show_progress=False) == True
+        assert mock_get.call_args.kwargs['headers'] == {}
+        assert (tmp_path / 'large.pdf').read_bytes() == b'complete'
+
+    @patch('intra42.requests.Session.get')
+    def test_download_attachment_http_error(self, mock_get, scraper):
+        """Test download_attachment handles HTTP errors"""
+        mock_get.return_value = _resp(404, {'content-length': '0'})
 
         with pytest.raises(Exception, match='Failed to download attachment: 404'):
             scraper.download_attachment('/uploads/missing.pdf', '/tmp/test.pdf')
 
+    @patch('intra42.os.replace')
+    @patch('intra42.os.posix_fallocate', create=True)
     @patch('intra42.tqdm')
     @patch('intra42.requests.Session.get')
     @patch('builtins.open', create=True)
-    def test_download_attachment_large_file_with_progress(self, mock_open, mock_get, mock_tqdm):
+    def test_download_attachment_large_file_with_progress(self, mock_open, mock_get, mock_tqdm, mock_fallocate, mock_replace, scraper):
         """Test download_attachment shows progress bar for large files (>1MB)"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.headers = {'content-length': '5000000'}  # 5MB file
-        mock_response.iter_content.return_value = [b'chunk1', b'chunk2']
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
-        mock_get.return_value = mock_response
+        mock_get.return_value = response = _resp(200, {'content-length': '5000000'}, [b'x' * 8192] * 100)  # 5MB file
 
         mock_file = MagicMock()
         mock_open.return_value.__enter__.return_value = mock_file
@@ -390,12 +807,45 @@ class TestIntraScrape:
         mock_progress = MagicMock()
         mock_tqdm.return_value = mock_progress
 
-        scraper = IntraScrape({})
         scraper.download_attachment('/uploads/large.pdf', '/tmp/large.pdf', show_progress=True)
 
         # Verify progress bar was created for large file
         mock_tqdm.assert_called_once()
         assert mock_tqdm.call_args.kwargs['total'] == 5000000
+        assert mock_tqdm.call_args.kwargs['desc'].strip() == 'large.pdf'
+        assert response.chunk_sizes == [1024 * 1024]
+        # Updates are batched, but add up to every received byte
+        assert mock_progress.update.call_count < 10
+        assert sum(call.args[0] for call in mock_progress.update.call_args_list) == 8192 * 100
+
+    @patch('intra42.os.posix_fallocate', create=True)
+    @patch('intra42.requests.Session.get')
+    def test_download_attachment_preallocates(self, mock_get, mock_fallocate, tmp_path, scraper):
+        """Test large downloads reserve disk space up front and are trimmed to the body size"""
+        mock_get.return_value = _resp(200, {'content-length': '5000000'}, [b'chunk1', b'chunk2'])
+
+        save_path = tmp_path / 'large.pdf'
+        scraper.download_attachment('/uploads/large.pdf', str(save_path), show_progress=False)
+
+        mock_fallocate.assert_called_once()
+        assert mock_fallocate.call_args.args[1:] == (0, 5000000)
+        assert save_path.read_bytes() == b'chunk1chunk2'
+
+    @patch('intra42.requests.Session.get')
+    def test_write_response_failure_trims_preallocation(self, mock_get, tmp_path, scraper):
+        """Test an interrupted transfer doesn't leave a file padded to Content-Length"""
+        def interrupted(chunk_size=None):
+            yield b'x' * 1024
+            raise requests.exceptions.ChunkedEncodingError('connection reset')
+
+        response = _resp(200, {'content-length': '5000000'})
+        response.iter_content = interrupted
+        save_path = tmp_path / 'large.pdf'
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            scraper._write_response(response, str(save_path), show_progress=False)
+
+        assert save_path.stat().st_size == 1024
 
     @patch('intra42.requests.Session')
     def test_get_remote_modified_time_success(self, mock_session_class):
@@ -408,12 +858,48 @@ class TestIntraScrape:
         mock_response.headers.get.return_value = 'Fri, 09 May 2025 12:16:12 GMT'
         mock_session.head.return_value = mock_response
 
-        scraper = IntraScrape({})
+        scraper = IntraScrape(_NO_COOKIES)
         timestamp = scraper.get_remote_modified_time('http://example.com/file.pdf')
 
         assert timestamp == 1746792972.0  # Unix timestamp for that date
         mock_session.head.assert_called_once_with('http://example.com/file.pdf', timeout=10)
 
+    @patch('intra42.requests.Session')
+    def test_get_remote_modified_time_cached(self, mock_session_class):
+        """Test remote modified time is requested once per URL"""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers.get.return_value = 'Fri, 09 May 2025 12:16:12 GMT'
+        mock_session.head.return_value = mock_response
+
+        scraper = IntraScrape(_NO_COOKIES)
+        first = scraper.get_remote_modified_time('http://example.com/file.pdf')
+        second = scraper.get_remote_modified_time('http://example.com/file.pdf')
+        assert first == second == 1746792972.0
+        assert mock_session.head.call_count == 1
+
+        scraper.get_remote_modified_time('http://example.com/file.pdf', use_cache=False)
+        assert mock_session.head.call_count == 2
+
+    @patch('intra42.requests.Session')
+    def test_get_remote_modified_time_nonstandard_format(self, mock_session_class):
+        """Test dates that aren't IMF-fixdate are still parsed"""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers.get.return_value = 'Fri, 9 May 2025 12:16:12 +0000'
+        mock_session.head.return_value = mock_response
+
+        scraper = IntraScrape(_NO_COOKIES)
+        timestamp = scraper.get_remote_modified_time('http://example.com/file.pdf')
+
+        assert timestamp == 1746792972.0
+
     @patch('intra42.requests.Session')
     def test_get_remote_modified_time_no_header(self, mock_session_class):
         """Test getting remote modified time when header is missing"""
@@ -425,15 +911,14 @@ class TestIntraScrape:
         mock_response.headers.get.return_value = None
         mock_session.head.return_value = mock_response
 
-        scraper = IntraScrape({})
+        scraper = IntraScrape(_NO_COOKIES)
         timestamp = scraper.get_remote_modified_time('http://example.com/file.pdf')
 
         assert timestamp == 0  # Returns 0 when header unavailable
 
     @patch('intra42.requests.Session')
-    @patch('intra42.os.path.exists')
-    @patch('intra42.os.path.getmtime')
-    def test_get_versioned_filepath_no_file(self, mock_getmtime, mock_exists, mock_session_class):
+    @patch('intra42._stat_or_none')
+    def test_get_versioned_filepath_no_file(self, mock_stat, mock_session_class):
         """Test versioned filepath when file doesn't exist"""
         mock_session = Mock()
         mock_session_class.return_value = mock_session
@@ -443,9 +928,9 @@ class TestIntraScrape:
         mock_response.headers.get.return_value = 'Fri, 09 May 2025 12:16:12 GMT'
         mock_session.head.return_value = mock_response
 
-        mock_exists.return_value = False
+        mock_stat.return_value = None
 
-        scraper = IntraScrape({})
+        scraper = IntraScrape(_NO_COOKIES)
         path, should_download = scraper.get_versioned_filepath(
             'http://example.com/file.pdf',
             '/downloads/file.pdf'
@@ -455,9 +940,8 @@ class TestIntraScrape:
         assert should_download == True
 
     @patch('intra42.requests.Session')
-    @patch('intra42.os.path.exists')
-    @patch('intra42.os.path.getmtime')
-    def test_get_versioned_filepath_file_exists_same_version(self, mock_getmtime, mock_exists, mock_session_class):
+    @patch('intra42._stat_or_none')
+    def test_get_versioned_filepath_file_exists_same_version(self, mock_stat, mock_session_class):
         """Test versioned filepath when file exists and is up-to-date"""
         mock_session = Mock()
         mock_session_class.return_value = mock_session
@@ -467,18 +951,15 @@ class TestIntraScrape:
         mock_response.headers.get.return_value = 'Fri, 09 May 2025 12:16:12 GMT'
         mock_session.head.return_value = mock_response
 
-        def exists_side_effect(path):
+        def stat_side_effect(path):
             # Versioned file doesn't exist, but base file does
-            if path == '/downloads/file_20250509_141612.pdf':
-                return False
             if path == '/downloads/file.pdf':
-                return True
-            return False
+                return Mock(st_mtime=1746792972.0)  # Same timestamp
+            return None
 
-        mock_exists.side_effect = exists_side_effect
-        mock_getmtime.return_value = 1746792972.0  # Same timestamp
+        mock_stat.side_effect = stat_side_effect
 
-        scraper = IntraScrape({})
+        scraper = IntraScrape(_NO_COOKIES)
         path, should_download = scraper.get_versioned_filepath(
             'http://example.com/file.pdf',
             '/downloads/file.pdf'
@@ -488,9 +969,8 @@ class TestIntraScrape:
         assert should_download == False  # Already up-to-date
 
     @patch('intra42.requests.Session')
-    @patch('intra42.os.path.exists')
-    @patch('intra42.os.path.getmtime')
-    def test_get_versioned_filepath_file_exists_newer_version(self, mock_getmtime, mock_exists, mock_session_class):
+    @patch('intra42._stat_or_none')
+    def test_get_versioned_filepath_file_exists_newer_version(self, mock_stat, mock_session_class):
         """Test versioned filepath when remote file is newer"""
         mock_session = Mock()
         mock_session_class.return_value = mock_session
@@ -500,16 +980,15 @@ class TestIntraScrape:
         mock_response.headers.get.return_value = 'Fri, 09 May 2025 12:16:12 GMT'
         mock_session.head.return_value = mock_response
 
-        def exists_side_effect(path):
+        def stat_side_effect(path):
             # Base file exists, versioned doesn't
             if path == '/downloads/file.pdf':
-                return True
-            return False
+                return Mock(st_mtime=1000000000.0)  # Much older timestamp
+            return None
 
-        mock_exists.side_effect = exists_side_effect
-        mock_getmtime.return_value = 1000000000.0  # Much older timestamp
+        mock_stat.side_effect = stat_side_effect
 
-        scraper = IntraScrape({})
+        scraper = IntraScrape(_NO_COOKIES)
         path, should_download = scraper.get_versioned_filepath(
             'http://example.com/file.pdf',
             '/downloads/file.pdf'
@@ -518,6 +997,235 @@ class TestIntraScrape:
         assert path == '/downloads/file_20250509_141612.pdf'  # Versioned filename
         assert should_download == True
 
+    @patch('intra42.requests.Session')
+    def test_get_versioned_filepaths(self, mock_session_class, tmp_path):
+        """Test batched versioned filepaths keep input order"""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+
+        def head_side_effect(url, timeout):
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.headers = {'Last-Modified': 'Fri, 09 May 2025 12:16:12 GMT'} if 'a.pdf' in url else {}
+            return mock_response
+
+        mock_session.head.side_effect = head_side_effect
+
+        scraper = IntraScrape(_NO_COOKIES)
+        results = scraper.get_versioned_filepaths([
+            ('http://example.com/a.pdf', str(tmp_path / 'a.pdf')),
+            ('http://example.com/b.pdf', str(tmp_path / 'b.pdf')),
+        ])
+
+        assert results == [(str(tmp_path / 'a.pdf'), True), (str(tmp_path / 'b.pdf'), False)]
+        assert mock_session.head.call_count == 2
+
+    @patch('intra42.requests.Session')
+    def test_get_versioned_filepaths_parallel(self, mock_session_class, tmp_path):
+        """Test batched HEAD requests are all in flight at once"""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+
+        # Only passes if all 8 HEAD requests run concurrently
+        barrier = threading.Barrier(8, timeout=5)
+
+        def head_side_effect(url, timeout):
+            barrier.wait()
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.headers = {'Last-Modified': 'Fri, 09 May 2025 12:16:12 GMT'}
+            return mock_response
+
+        mock_session.head.side_effect = head_side_effect
+
+        scraper = IntraScrape(_NO_COOKIES)
+        pairs = [(f'http://example.com/{i}.pdf', str(tmp_path / f'{i}.pdf')) for i in range(8)]
+        results = scraper.get_versioned_filepaths(pairs, max_workers=8)
+
+        assert results == [(path, True) for _, path in pairs]
+
+    @patch('intra42.requests.Session.get')
+    def test_download_versioned_not_modified(self, mock_get, tmp_path, scraper):
+        """Test download_versioned sends If-Modified-Since and skips on 304"""
+        base_path = tmp_path / 'file.pdf'
+        base_path.write_bytes(b'old')
+        os.utime(base_path, (1746792972.0, 1746792972.0))
+
+        mock_get.return_value = _resp(304)
+
+        path, downloaded = scraper.download_versioned('http://example.com/file.pdf', str(base_path))
+
+        assert path == str(base_path)
+        assert downloaded == False
+        sent_headers = mock_get.call_args.kwargs['headers']
+        assert sent_headers['If-Modified-Since'] == 'Fri, 09 May 2025 12:16:12 GMT'
+        assert base_path.read_bytes() == b'old'
+
+    @patch('intra42.requests.Session.get')
+    def test_download_versioned_first_download(self, mock_get, tmp_path, scraper):
+        """Test download_versioned saves to the base path when nothing exists locally"""
+        base_path = tmp_path / 'file.pdf'
+
+        mock_get.return_value = _resp(200, {'Last-Modified': 'Fri, 09 May 2025 12:16:12 GMT'}, [b'new'])
+
+        path, downloaded = scraper.download_versioned('http://example.com/file.pdf', str(base_path))
+
+        assert path == str(base_path)
+        assert downloaded == True
+        assert mock_get.call_args.kwargs['headers'] == {}
+        assert base_path.read_bytes() == b'new'
+        assert os.path.getmtime(base_path) == 1746792972.0
+
+    @patch('intra42.requests.Session.get')
+    def test_download_versioned_interrupted(self, mock_get, tmp_path, scraper):
+        """Test an interrupted first download leaves no base file to be revalidated as current"""
+        def interrupted(chunk_size=None):
+            yield b'partial'
+            raise requests.exceptions.ChunkedEncodingError('connection reset')
+
+        response = _resp(200, {'Last-Modified': 'Fri, 09 May 2025 12:16:12 GMT'})
+        response.iter_content = interrupted
+        mock_get.return_value = response
+        base_path = tmp_path / 'file.pdf'
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            scraper.download_versioned('http://example.com/file.pdf', str(base_path), show_progress=False)
+
+        assert os.listdir(tmp_path) == []
+
+    @patch('intra42.requests.Session.get')
+    def test_download_versioned_newer_version(self, mock_get, tmp_path, scraper):
+        """Test download_versioned saves a modified remote file under a versioned name"""
+        base_path = tmp_path / 'file.pdf'
+        base_path.write_bytes(b'old')
+        os.utime(base_path, (1000000000.0, 1000000000.0))
+
+        mock_get.return_value = _resp(200, {'Last-Modified': 'Fri, 09 May 2025 12:16:12 GMT'}, [b'new'])
+
+        path, downloaded = scraper.download_versioned('http://example.com/file.pdf', str(base_path))
+
+        expected = tmp_path / f"file_{datetime.fromtimestamp(1746792972.0):%Y%m%d_%H%M%S}.pdf"
+        assert path == str(expected)
+        assert downloaded == True
+        assert base_path.read_bytes() == b'old'
+        assert expected.read_bytes() == b'new'
+
+    @patch('intra42.requests.Session.get')
+    def test_download_versioned_versioned_copy_exists(self, mock_get, tmp_path, scraper):
+        """Test download_versioned skips when only the versioned copy of the remote file exists"""
+        base_path = tmp_path / 'file.pdf'
+        expected = tmp_path / f"file_{datetime.fromtimestamp(1746792972.0):%Y%m%d_%H%M%S}.pdf"
+        expected.write_bytes(b'current')
+
+        mock_get.return_value = _resp(200, {'Last-Modified': 'Fri, 09 May 2025 12:16:12 GMT'}, [b'new'])
+
+        path, downloaded = scraper.download_versioned('http://example.com/file.pdf', str(base_path))
+
+        assert path == str(expected)
+        assert downloaded == False
+        assert not base_path.exists()
+        assert expected.read_bytes() == b'current'
+
+    @patch('intra42.requests.Session.get')
+    def test_download_versioned_no_last_modified(self, mock_get, tmp_path, scraper):
+        """Test download_versioned skips like get_versioned_filepath without a Last-Modified header"""
+        base_path = tmp_path / 'file.pdf'
+
+        mock_get.return_value = _resp(200, {}, [b'new'])
+
+        path, downloaded = scraper.download_versioned('http://example.com/file.pdf', str(base_path))
+
+        assert path == str(base_path)
+        assert downloaded == False
+        assert os.listdir(tmp_path) == []
+
+    def test_download_all_attachments_concurrent(self, scraper):
+        """Test downloads run max_concurrent at a time and results keep input order"""
+        # Only passes if 5 downloads are in flight at once
+        barrier = threading.Barrier(5, timeout=5)
+
+        def download_side_effect(url, save_path, show_progress):
+            barrier.wait()
+            return url.endswith('0.pdf')
+
+        items = [(f'https://cdn.intra.42.fr/{i}.pdf', f'/tmp/{i}.pdf') for i in range(10)]
+        with patch.object(scraper, 'download_attachment', side_effect=download_side_effect) as mock_download:
+            results = scraper.download_all_attachments(items, max_concurrent=5, show_progress=False)
+
+        assert results == [True] + [False] * 9
+        assert mock_download.call_count == 10
+
+    def test_scrape_all(self, tmp_path, scraper):
+        """Test scrape_all downloads each project's attachments into its own folder"""
+        scraper.all_projects = [
+            {'name': 'libft', 'url': '/projects/42cursus-libft'},
+            {'name': 'empty', 'url': '/projects/42cursus-empty'},
+        ]
+        attachments = {
+            '/projects/42cursus-libft': ['https://cdn.intra.42.fr/pdf/en.subject.pdf?v=2'],
+            '/projects/42cursus-empty': [],
+        }
+        with patch.object(scraper, 'get_project_attachments', side_effect=attachments.get), \
+                patch.object(scraper, 'download_versioned', side_effect=lambda url, path, progress: (path, True)) as mock_download:
+            results = scraper.scrape_all(str(tmp_path), max_workers=2)
+
+        expected = str(tmp_path / '42cursus-libft' / 'en.subject.pdf')
+        assert results == {
+            '/projects/42cursus-libft': [(expected, True)],
+            '/projects/42cursus-empty': [],
+        }
+        mock_download.assert_called_once_with('https://cdn.intra.42.fr/pdf/en.subject.pdf?v=2', expected, False)
+        assert (tmp_path / '42cursus-empty').is_dir()
+
+    @patch('intra42.tqdm.write')
+    def test_scrape_all_project_page_error(self, mock_write, tmp_path, scraper):
+        """Test a project page that fails is reported without losing the other projects' results"""
+        scraper.all_projects = [
+            {'name': 'libft', 'url': '/projects/42cursus-libft'},
+            {'name': 'broken', 'url': '/projects/42cursus-broken'},
+        ]
+
+        def get_attachments(project_url):
+            if project_url == '/projects/42cursus-broken':
+                raise Exception('Failed to retrieve project page: 500')
+            return ['https://cdn.intra.42.fr/pdf/en.subject.pdf']
+
+        with patch.object(scraper, 'get_project_attachments', side_effect=get_attachments), \
+                patch.object(scraper, 'download_versioned', side_effect=lambda url, path, progress: (path, True)):
+            results = scraper.scrape_all(str(tmp_path), max_workers=2)
+
+        assert results == {
+            '/projects/42cursus-libft': [(str(tmp_path / '42cursus-libft' / 'en.subject.pdf'), True)],
+            '/projects/42cursus-broken': [],
+        }
+        mock_write.assert_called_once()
+        assert '/projects/42cursus-broken' in mock_write.call_args.args[0]
+        assert '500' in mock_write.call_args.args[0]
+
+    def test_scrape_all_same_filename(self, tmp_path, scraper):
+        """Test attachments of one project sharing a file name are saved to distinct paths"""
+        scraper.all_projects = [{'name': 'libft', 'url': '/projects/42cursus-libft'}]
+        urls = [
+            'https://cdn.intra.42.fr/pdf/1/en.subject.pdf',
+            'https://cdn.intra.42.fr/pdf/2/en.subject.pdf',
+            'https://cdn.intra.42.fr/pdf/2/en.subject.pdf',
+        ]
+        responses = {
+            url: _resp(200, {'Last-Modified': 'Fri, 09 May 2025 12:16:12 GMT'}, [f'body{i}'.encode()])
+            for i, url in enumerate(urls)
+        }
+        with patch.object(scraper, 'get_project_attachments', return_value=urls), \
+                patch('intra42.requests.Session.get', side_effect=lambda url, **kwargs: responses[url]):
+            results = scraper.scrape_all(str(tmp_path), max_workers=3)
+
+        project_dir = tmp_path / '42cursus-libft'
+        assert results['/projects/42cursus-libft'] == [
+            (str(project_dir / 'en.subject_1.pdf'), True),
+            (str(project_dir / 'en.subject_2.pdf'), True),
+            (str(project_dir / 'en.subject_2_2.pdf'), True),
+        ]
+        assert sorted(os.listdir(project_dir)) == ['en.subject_1.pdf', 'en.subject_2.pdf', 'en.subject_2_2.pdf']
+
     @patch('intra42.requests.Session')
     def test_get_total_pages(self, mock_session_class):
         """Test extracting total page count from pagination"""
@@ -526,68 +1234,131 @@ class TestIntraScrape:
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = '''
-            <div id="projects-list-container">
-                <div>
-                    <ul>
-                        <li class="last">
-                            <a href="/projects/list?page=17">Last</a>
-                        </li>
-                    </ul>
-                </div>
-            </div>
-        '''
+        mock_response.encoding = 'utf-8'
+        mock_response.content = _HTML_LAST_PAGE_17
         mock_session.get.return_value = mock_response
 
-        scraper = IntraScrape({})
+        scraper = IntraScrape(_NO_COOKIES)
         total_pages = scraper._get_total_pages()
 
         assert total_pages == 17
 
     @patch('intra42.requests.Session')
-    @patch('intra42.IntraScrape._get_total_pages')
-    @patch('intra42.IntraScrape._get_project_list_page')
-    def test_parallel_pagination(self, mock_get_page, mock_get_total, mock_session_class):
-        """Test parallel pagination fetches all pages"""
+    def test_total_pages_cached(self, mock_session_class, monkeypatch):
+        """Test the page count is reused until PROJECT_LIST_TTL has passed"""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.get.return_value.status_code = 200
+        mock_session.get.return_value.encoding = 'utf-8'
+        mock_session.get.return_value.content = b'<ul><li class="last"><a href="?page=4">Last</a></li></ul>'
+
+        scraper = IntraScrape(_NO_COOKIES)
+        scraper._get_total_pages()
+        scraper._get_total_pages()
+        assert mock_session.get.call_count == 1
+
+        monkeypatch.setattr('intra42.time', _time_shifted(IntraScrape.PROJECT_LIST_TTL))
+        scraper._get_total_pages()
+        assert mock_session.get.call_count == 2
+
+    @patch('intra42.requests.Session')
+    def test_get_all_projects_uses_cache(self, mock_session_class):
+        """Test repeated listings and lookups reuse the scraped project list"""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_session.get.return_value.status_code = 200
+        mock_session.get.return_value.encoding = 'utf-8'
+        mock_session.get.return_value.content = _HTML_SINGLE_PROJECT
+
+        scraper = IntraScrape(_NO_COOKIES)
+        scraper.get_all_projects()
+        scraper.get_all_projects()
+        assert scraper.get_project_url_by_name('libft') == '/projects/libft'
+        assert mock_session.get.call_count == 1
+
+        scraper.get_all_projects(refresh=True)
+        assert mock_session.get.call_count == 2
+
+    @patch('intra42.requests.Session')
+    def test_first_page_fetched_once(self, mock_session_class):
+        """Test page 1 provides both the page count and its items from one request and parse"""
         mock_session = Mock()
         mock_session_class.return_value = mock_session
 
-        mock_get_total.return_value = 3
+        def get_side_effect(url):
+            page = int(url.split('page=')[1])
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.encoding = 'utf-8'
+            mock_response.content = _projects_html(((f'Project{page}', f'/p{page}'),), last_page=3)
+            return mock_response
+
+        mock_session.get.side_effect = get_side_effect
+
+        scraper = IntraScrape(_NO_COOKIES)
+        with patch('intra42._parse_html', wraps=intra42._parse_html) as mock_parse:
+            projects = scraper.get_all_projects()
+
+        assert [p['url'] for p in projects] == ['/p1', '/p2', '/p3']
+        assert mock_parse.call_count == 3  # page 1 is parsed once, not once per use
+        requested = sorted(call.args[0] for call in mock_session.get.call_args_list)
+        assert requested == [f"https://projects.intra.42.fr/projects/list?page={p}" for p in (1, 2, 3)]
+
+        # A refreshed listing still fetches each page exactly once
+        mock_session.get.reset_mock()
+        scraper.get_all_projects(refresh=True)
+        assert mock_session.get.call_count == 3
+
+    @patch('intra42.requests.Session')
+    @patch('intra42.IntraScrape._fetch_project_list_page')
+    def test_parallel_pagination(self, mock_fetch_page, mock_session_class):
+        """Test parallel pagination fetches all pages and keeps page order"""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
 
         # Mock different responses for each page
-        from bs4 import BeautifulSoup
-        def get_page_side_effect(page):
-            html = f'<li class="project-item"><div class="project-name"><a href="/p{page}">Project{page}</a></div></li>'
-            soup = BeautifulSoup(html, 'html.parser')
-            return [soup.find('li')]
+        def fetch_page_side_effect(page):
+            return (_projects_html(((f'Project{page}', f'/p{page}'),)), 'utf-8')
 
-        mock_get_page.side_effect = get_page_side_effect
+        mock_fetch_page.side_effect = fetch_page_side_effect
 
-        scraper = IntraScrape({})
+        scraper = IntraScrape(_NO_COOKIES)
+        scraper._total_pages = 3
         results = scraper._get_project_list(parallel=True, max_workers=2)
 
         assert len(results) == 3
-        assert mock_get_page.call_count == 3
+        assert [item.find('.//a').get('href') for item in results] == ['/p1', '/p2', '/p3']
+        assert mock_fetch_page.call_count == 3
+
+    @patch('intra42.ThreadPoolExecutor', wraps=ThreadPoolExecutor)
+    @patch('intra42.requests.Session')
+    @patch('intra42.IntraScrape._fetch_project_list_page')
+    def test_parallel_pagination_caps_workers(self, mock_fetch_page, mock_session_class, mock_executor_class):
+        """Test parallel pagination never starts more workers than pages"""
+        mock_fetch_page.return_value = (b'<html></html>', 'utf-8')
+
+        scraper = IntraScrape(_NO_COOKIES)
+        scraper._total_pages = 3
+        scraper._get_project_list(parallel=True, max_workers=32)
+
+        mock_executor_class.assert_called_once_with(max_workers=3)
 
     @patch('intra42.requests.Session')
-    @patch('intra42.IntraScrape._get_total_pages')
     @patch('intra42.IntraScrape._get_project_list_page')
-    def test_sequential_pagination(self, mock_get_page, mock_get_total, mock_session_class):
+    def test_sequential_pagination(self, mock_get_page, mock_session_class):
         """Test sequential pagination fetches all pages"""
         mock_session = Mock()
         mock_session_class.return_value = mock_session
 
-        mock_get_total.return_value = 2
-
-        from bs4 import BeautifulSoup
+        from lxml import html as lxml_html
         def get_page_side_effect(page):
             html = f'<li class="project-item"><div class="project-name"><a href="/p{page}">Project{page}</a></div></li>'
-            soup = BeautifulSoup(html, 'html.parser')
-            return [soup.find('li')]
+            return [lxml_html.fragment_fromstring(html)]
 
         mock_get_page.side_effect = get_page_side_effect
 
-        scraper = IntraScrape({})
+        scraper = IntraScrape(_NO_COOKIES)
+        scraper._total_pages = 2
         results = scraper._get_project_list(parallel=False)
 
         assert len(results) == 2
@@ -599,7 +1370,7 @@ class TestIntraScrape:
         mock_session = Mock()
         mock_session_class.return_value = mock_session
 
-        scraper = IntraScrape({})
+        scraper = IntraScrape(_NO_COOKIES)
         # Set all_projects directly instead of mocking get_all_projects
         scraper.all_projects = [
             {'name': 'libft', 'url': '/projects/libft'},
@@ -613,6 +1384,52 @@ class TestIntraScrape:
         assert scraper.projects_to_scrape[0]['name'] == 'libft'
         assert scraper.projects_to_scrape[1]['name'] == 'minishell'
 
+    @patch('intra42.requests.Session')
+    def test_get_projects_to_scrape_case_insensitive(self, mock_session_class):
+        """Test project names match case-insensitively, in the requested order"""
+        scraper = IntraScrape(_NO_COOKIES)
+        scraper.all_projects = [
+            {'name': 'Libft', 'url': '/projects/libft'},
+            {'name': 'ft_printf', 'url': '/projects/ft_printf'},
+            {'name': 'minishell', 'url': '/projects/minishell'}
+        ]
+
+        projects = scraper.get_projects_to_scrape(['MINISHELL', 'libft', 'Libft'])
+
+        assert [p['url'] for p in projects] == ['/projects/minishell', '/projects/libft']
+        assert scraper.get_project_url_by_name('FT_PRINTF') == '/projects/ft_printf'
+
+    @patch('intra42.requests.Session')
+    def test_get_projects_to_scrape_shared_name(self, mock_session_class):
+        """Test every project carrying a requested name is returned; URL lookup keeps the first"""
+        scraper = IntraScrape(_NO_COOKIES)
+        scraper.all_projects = [
+            {'name': 'Libft', 'url': '/projects/42cursus-libft'},
+            {'name': 'minishell', 'url': '/projects/minishell'},
+            {'name': 'libft', 'url': '/projects/libft'}
+        ]
+
+        projects = scraper.get_projects_to_scrape(['libft'])
+
+        assert [p['url'] for p in projects] == ['/projects/42cursus-libft', '/projects/libft']
+        assert scraper.get_project_url_by_name('libft') == '/projects/42cursus-libft'
+
+    @patch('intra42.requests.Session')
+    def test_get_projects_to_scrape_missing_name(self, mock_session_class):
+        """Test unknown project names are skipped without error or extra requests"""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        scraper = IntraScrape(_NO_COOKIES)
+        scraper.all_projects = [
+            {'name': 'libft', 'url': '/projects/libft'},
+            {'name': 'minishell', 'url': '/projects/minishell'}
+        ]
+
+        projects = scraper.get_projects_to_scrape(['does_not_exist', 'minishell'])
+
+        assert projects == [{'name': 'minishell', 'url': '/projects/minishell'}]
+        assert scraper.projects_to_scrape == projects
+        mock_session.get.assert_not_called()
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])